@@ -1,19 +1,30 @@
 """Mobile-inspired Tkinter journaling experience."""
 from __future__ import annotations
 
+import base64
 import os
 import random
-import subprocess
+import struct
 import sys
 import textwrap
 import tkinter as tk
-from datetime import datetime
+import zlib
+from bisect import bisect_left
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from tkinter import font as tkfont, messagebox, ttk
 
 APP_TITLE = "Calm Journal"
 ENTRY_DIR = Path(__file__).parent / "entries"
 DATE_FORMAT = "%Y-%m-%d"
+SNIPPET_BYTES = 256
+CLOUD_TICK_MS = 100
+CLOUD_SIZES = (160, 210, 260)
+CLOUD_TINT_FACTORS = (0.4, 0.575, 0.75)
+# (top, bottom) of each overlapping bump relative to the cloud's row.
+CLOUD_BUMPS = ((-8, 72), (-14, 84), (2, 66))
+CLOUD_ALPHA = 80
 
 COLORS = {
     "gradient_top": "#d7e8ff",
@@ -46,27 +57,116 @@ AFFIRMATIONS = [
     "You are crafting proof that you were here.",
 ]
 
+FONT_FAMILY = "Segoe UI"
+FONT_SPECS: dict[str, dict[str, object]] = {
+    "small": {"size": 10},
+    "small_bold": {"size": 10, "weight": "bold"},
+    "body": {"size": 11},
+    "bold": {"size": 11, "weight": "bold"},
+    "italic": {"size": 11, "slant": "italic"},
+    "entry": {"size": 12},
+    "card_title": {"size": 12, "weight": "bold"},
+    "greeting": {"size": 14, "weight": "bold"},
+    "heading": {"size": 18, "weight": "bold"},
+    "title": {"size": 24, "weight": "bold"},
+}
+_FONTS: dict[str, tkfont.Font] = {}
 
-def blend_colors(color_a: str, color_b: str, factor: float) -> str:
-    """Linearly blend two hex colors for soft gradients."""
-    def hex_to_rgb(value: str) -> tuple[int, int, int]:
-        value = value.lstrip("#")
-        return tuple(int(value[i : i + 2], 16) for i in (0, 2, 4))
-
-    r1, g1, b1 = hex_to_rgb(color_a)
-    r2, g2, b2 = hex_to_rgb(color_b)
-    r = int(r1 + (r2 - r1) * factor)
-    g = int(g1 + (g2 - g1) * factor)
-    b = int(b1 + (b2 - b1) * factor)
+
+@lru_cache(maxsize=None)
+def _hex_to_rgb(value: str) -> tuple[int, int, int]:
+    value = value.lstrip("#")
+    return tuple(int(value[i : i + 2], 16) for i in (0, 2, 4))
+
+
+@lru_cache(maxsize=512)
+def _blend_quantized(color_a: str, color_b: str, step: int) -> str:
+    r1, g1, b1 = _hex_to_rgb(color_a)
+    r2, g2, b2 = _hex_to_rgb(color_b)
+    r = r1 + (r2 - r1) * step // 255
+    g = g1 + (g2 - g1) * step // 255
+    b = b1 + (b2 - b1) * step // 255
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
+def blend_colors(color_a: str, color_b: str, factor: float) -> str:
+    """Linearly blend two hex colors for soft gradients.
+
+    The factor is quantized to 1/255 steps so repeated blends hit the cache.
+    """
+    return _blend_quantized(color_a, color_b, round(factor * 255))
+
+
+@lru_cache(maxsize=None)
+def gradient_palette(color_a: str, color_b: str) -> tuple[str, ...]:
+    """Return every quantized blend step between two colors in one table."""
+    return tuple(_blend_quantized(color_a, color_b, step) for step in range(256))
+
+
+@lru_cache(maxsize=512)
+def pretty_date(stem: str) -> str:
+    """Format a YYYY-MM-DD entry stem as a short card label."""
+    return date.fromisoformat(stem).strftime("%b %d")
+
+
+def _encode_png(width: int, height: int, rows: list[bytes]) -> bytes:
+    def chunk(kind: bytes, payload: bytes) -> bytes:
+        body = kind + payload
+        return struct.pack(">I", len(payload)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    pixels = zlib.compress(b"".join(b"\x00" + row for row in rows))
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", pixels) + chunk(b"IEND", b"")
+
+
+@lru_cache(maxsize=None)
+def cloud_sprite_png(size: int, tint: str, scale: int = 2) -> bytes:
+    """Rasterize a soft three-bump cloud as RGBA PNG data at 1/scale resolution."""
+    top = min(y0 for y0, _ in CLOUD_BUMPS)
+    bottom = max(y1 for _, y1 in CLOUD_BUMPS)
+    width = int(size * 1.8) // scale + 1
+    height = (bottom - top) // scale + 1
+    ellipses = [
+        (
+            (bump * size * 0.4 + size / 2) / scale,
+            ((y0 + y1) / 2 - top) / scale,
+            size / 2 / scale,
+            (y1 - y0) / 2 / scale,
+        )
+        for bump, (y0, y1) in enumerate(CLOUD_BUMPS)
+    ]
+    r, g, b = _hex_to_rgb(tint)
+    rows = []
+    for py in range(height):
+        row = bytearray()
+        for px in range(width):
+            coverage = 0.0
+            for cx, cy, rx, ry in ellipses:
+                dx = (px - cx) / rx
+                dy = (py - cy) / ry
+                coverage = max(coverage, 1.0 - dx * dx - dy * dy)
+            # Fade the outer third of each bump so edges read as soft.
+            alpha = int(CLOUD_ALPHA * min(coverage * 3.0, 1.0)) if coverage > 0 else 0
+            row += bytes((r, g, b, alpha))
+        rows.append(bytes(row))
+    return _encode_png(width, height, rows)
+
+
+def shared_fonts(root: tk.Misc) -> dict[str, tkfont.Font]:
+    """Create the named app fonts once and hand back the shared instances."""
+    if not _FONTS:
+        for name, options in FONT_SPECS.items():
+            _FONTS[name] = tkfont.Font(root=root, family=FONT_FAMILY, **options)
+    return _FONTS
+
+
 class CloudLayer:
     """Renders slow floating cloud blobs behind the phone cards."""
 
     def __init__(self, canvas: tk.Canvas) -> None:
         self.canvas = canvas
         self.clouds: list[dict[str, object]] = []
+        self.sprites: dict[tuple[int, str], tk.PhotoImage] = {}
         self.canvas.bind("<Configure>", self._reset, add="+")
         self.canvas.after(50, self._reset)
         self.canvas.after(120, self._animate)
@@ -79,47 +179,58 @@ class CloudLayer:
         self.canvas.delete("cloud")
         self.clouds.clear()
         cloud_count = max(width // 220, 4)
+        sizes = [random.choice(CLOUD_SIZES) for _ in range(cloud_count)]
+        lefts = [random.randint(-80, width - size) for size in sizes]
+        tops = [random.randint(40, int(height * 0.6)) for _ in range(cloud_count)]
+        tints = [
+            blend_colors(COLORS["gradient_top"], "#ffffff", random.choice(CLOUD_TINT_FACTORS))
+            for _ in range(cloud_count)
+        ]
+        top_offset = min(y0 for y0, _ in CLOUD_BUMPS)
         for idx in range(cloud_count):
             tag = f"cloud_{idx}"
-            size = random.randint(160, 260)
-            x = random.randint(-80, width - size)
-            y = random.randint(40, int(height * 0.6))
-            tint = blend_colors(COLORS["gradient_top"], "#ffffff", random.uniform(0.4, 0.75))
-            for bump in range(3):
-                offset = bump * size * 0.4
-                self.canvas.create_oval(
-                    x + offset,
-                    y + random.randint(-10, 15),
-                    x + offset + size,
-                    y + random.randint(50, 90),
-                    fill=tint,
-                    outline="",
-                    tags=("cloud", tag),
-                    stipple="gray25",
-                )
+            x, y = lefts[idx], tops[idx]
+            self.canvas.create_image(
+                x,
+                y + top_offset,
+                anchor="nw",
+                image=self._sprite(sizes[idx], tints[idx]),
+                tags=("cloud", tag),
+            )
             self.clouds.append({
                 "tag": tag,
-                "speed": 0.2 + random.random() * 0.2,
+                # Pixels per tick, scaled so drift speed is independent of the tick length.
+                "speed": (0.2 + random.random() * 0.2) * CLOUD_TICK_MS / 60,
+                "x": float(x),
                 "vertical": y,
             })
 
+    def _sprite(self, size: int, tint: str) -> tk.PhotoImage:
+        key = (size, tint)
+        if key not in self.sprites:
+            data = base64.b64encode(cloud_sprite_png(size, tint))
+            self.sprites[key] = tk.PhotoImage(master=self.canvas, data=data).zoom(2)
+        return self.sprites[key]
+
     def _animate(self) -> None:
+        if not self.canvas.winfo_viewable():
+            self.canvas.after(250, self._animate)
+            return
+        # Cloud positions are tracked here so no per-tick bbox queries are needed.
         width = self.canvas.winfo_width()
         height = self.canvas.winfo_height()
         for cloud in self.clouds:
             tag = cloud["tag"]
             speed = cloud["speed"]
             self.canvas.move(tag, speed, 0)
-            bbox = self.canvas.bbox(tag)
-            if not bbox:
-                continue
-            if bbox[0] > width + 60:
+            cloud["x"] += speed
+            if cloud["x"] > width + 60:
                 new_left = -random.randint(150, 280)
                 new_top = random.randint(40, int(height * 0.6))
-                delta_x = new_left - bbox[0]
-                delta_y = new_top - bbox[1]
-                self.canvas.move(tag, delta_x, delta_y)
-        self.canvas.after(60, self._animate)
+                self.canvas.move(tag, new_left - cloud["x"], new_top - cloud["vertical"])
+                cloud["x"] = new_left
+                cloud["vertical"] = new_top
+        self.canvas.after(CLOUD_TICK_MS, self._animate)
 
 
 class JournalApp:
@@ -131,10 +242,14 @@ class JournalApp:
         self.root.geometry("1280x720")
         self.root.minsize(1100, 620)
         ENTRY_DIR.mkdir(exist_ok=True)
+        # Oldest first; kept sorted in memory so saves never rescan the folder.
+        with os.scandir(ENTRY_DIR) as scan:
+            self._entry_names = sorted(item.name for item in scan if item.name.endswith(".txt"))
 
-        self.body_font = tkfont.Font(family="Segoe UI", size=11)
-        self.bold_font = tkfont.Font(family="Segoe UI", size=11, weight="bold")
-        self.italic_font = tkfont.Font(family="Segoe UI", size=11, slant="italic")
+        self.fonts = shared_fonts(self.root)
+        self.body_font = self.fonts["body"]
+        self.bold_font = self.fonts["bold"]
+        self.italic_font = self.fonts["italic"]
 
         self.date_var = tk.StringVar(value=self._today_string())
         self.metrics_var = tk.StringVar(value="0 chars  0 words")
@@ -142,6 +257,15 @@ class JournalApp:
         self.prompt_var = tk.StringVar(value=random.choice(PROMPTS))
         self.affirmation_var = tk.StringVar(value=random.choice(AFFIRMATIONS))
         self.card_widgets: dict[str, tk.Frame] = {}
+        self._empty_cards_label: tk.Label | None = None
+        self._gradient_image = tk.PhotoImage(master=self.root)
+        self._gradient_column: tuple[tuple[str], ...] = ()
+        self._gradient_item: int | None = None
+        self._resize_job: str | None = None
+        self._metrics_job: str | None = None
+        self._applied_tags: set[str] = set()
+        self._canvas_size = (0, 0)
+        self._phone_height: int | None = None
 
         self._configure_styles()
         self._build_layout()
@@ -154,7 +278,7 @@ class JournalApp:
             style.theme_use("clam")
         except tk.TclError:
             pass
-        style.configure("Toolbar.TButton", font=("Segoe UI", 10, "bold"), padding=(10, 4), relief="flat")
+        style.configure("Toolbar.TButton", font=self.fonts["small_bold"], padding=(10, 4), relief="flat")
         style.map(
             "Toolbar.TButton",
             background=[("active", COLORS["accent_soft"])],
@@ -187,14 +311,14 @@ class JournalApp:
         tk.Label(
             header,
             text="Hi, Tuba", 
-            font=("Segoe UI", 14, "bold"),
+            font=self.fonts["greeting"],
             fg="white",
             bg=COLORS["left_bg"],
         ).pack(anchor="w")
         tk.Label(
             header,
             text="My Notes",
-            font=("Segoe UI", 24, "bold"),
+            font=self.fonts["title"],
             fg="white",
             bg=COLORS["left_bg"],
             pady=6,
@@ -211,7 +335,7 @@ class JournalApp:
                 bg=COLORS["accent"] if active else "#1a1f34",
                 padx=14,
                 pady=6,
-                font=("Segoe UI", 10, "bold" if active else "normal"),
+                font=self.fonts["small_bold" if active else "small"],
                 bd=0,
                 relief="flat",
                 cursor="hand2",
@@ -225,14 +349,14 @@ class JournalApp:
         tk.Label(
             prompt_box,
             text="Tonight's spark",
-            font=("Segoe UI", 10, "bold"),
+            font=self.fonts["small_bold"],
             fg=COLORS["left_muted"],
             bg="#151a2d",
         ).pack(anchor="w", pady=(4, 2))
         tk.Label(
             prompt_box,
             textvariable=self.prompt_var,
-            font=("Segoe UI", 11),
+            font=self.fonts["body"],
             wraplength=250,
             fg="white",
             bg="#151a2d",
@@ -240,7 +364,7 @@ class JournalApp:
         tk.Label(
             prompt_box,
             textvariable=self.affirmation_var,
-            font=("Segoe UI", 10),
+            font=self.fonts["small"],
             fg=COLORS["left_muted"],
             bg="#151a2d",
             wraplength=250,
@@ -250,7 +374,7 @@ class JournalApp:
             prompt_box,
             text="New spark",
             command=self._refresh_prompt,
-            font=("Segoe UI", 10, "bold"),
+            font=self.fonts["small_bold"],
             fg=COLORS["text_dark"],
             bg=COLORS["accent_soft"],
             relief="flat",
@@ -264,7 +388,7 @@ class JournalApp:
             self.left_phone,
             text="View archive",
             command=self._open_entries_folder,
-            font=("Segoe UI", 10, "bold"),
+            font=self.fonts["small_bold"],
             fg=COLORS["left_bg"],
             bg="white",
             relief="flat",
@@ -278,14 +402,14 @@ class JournalApp:
         tk.Label(
             self.right_phone,
             text="Journal entry",
-            font=("Segoe UI", 18, "bold"),
+            font=self.fonts["heading"],
             fg=COLORS["text_dark"],
             bg=COLORS["right_bg"],
         ).pack(anchor="w")
         tk.Label(
             self.right_phone,
             text="Capture the details of today before they fade",
-            font=("Segoe UI", 11),
+            font=self.fonts["body"],
             fg=COLORS["text_muted"],
             bg=COLORS["right_bg"],
             pady=4,
@@ -296,13 +420,13 @@ class JournalApp:
         tk.Label(
             date_row,
             text="Entry date",
-            font=("Segoe UI", 10, "bold"),
+            font=self.fonts["small_bold"],
             fg=COLORS["text_muted"],
             bg=COLORS["right_bg"],
         ).pack(anchor="w")
         entry_bar = tk.Frame(self.right_phone, bg=COLORS["right_bg"])
         entry_bar.pack(fill="x")
-        self.date_entry = ttk.Entry(entry_bar, textvariable=self.date_var, font=("Segoe UI", 12))
+        self.date_entry = ttk.Entry(entry_bar, textvariable=self.date_var, font=self.fonts["entry"])
         self.date_entry.pack(side="left", fill="x", expand=True, ipadx=4, ipady=4)
         tk.Button(
             entry_bar,
@@ -310,7 +434,7 @@ class JournalApp:
             command=self._set_today,
             bg=COLORS["accent_soft"],
             fg=COLORS["text_dark"],
-            font=("Segoe UI", 10, "bold"),
+            font=self.fonts["small_bold"],
             relief="flat",
             bd=0,
             padx=10,
@@ -322,7 +446,7 @@ class JournalApp:
             command=self._new_entry,
             bg="white",
             fg=COLORS["text_dark"],
-            font=("Segoe UI", 10, "bold"),
+            font=self.fonts["small_bold"],
             relief="flat",
             bd=0,
             padx=10,
@@ -362,8 +486,8 @@ class JournalApp:
 
         status = tk.Frame(self.right_phone, bg=COLORS["right_bg"])
         status.pack(fill="x", pady=(0, 10))
-        tk.Label(status, textvariable=self.metrics_var, fg=COLORS["text_muted"], bg=COLORS["right_bg"], font=("Segoe UI", 10)).pack(side="left")
-        tk.Label(status, textvariable=self.status_var, fg=COLORS["warning"], bg=COLORS["right_bg"], font=("Segoe UI", 10, "bold")).pack(side="right")
+        tk.Label(status, textvariable=self.metrics_var, fg=COLORS["text_muted"], bg=COLORS["right_bg"], font=self.fonts["small"]).pack(side="left")
+        tk.Label(status, textvariable=self.status_var, fg=COLORS["warning"], bg=COLORS["right_bg"], font=self.fonts["small_bold"]).pack(side="right")
 
         action_row = tk.Frame(self.right_phone, bg=COLORS["right_bg"])
         action_row.pack(fill="x")
@@ -373,7 +497,7 @@ class JournalApp:
             command=self._save_entry,
             bg=COLORS["accent"],
             fg="white",
-            font=("Segoe UI", 11, "bold"),
+            font=self.fonts["bold"],
             relief="flat",
             bd=0,
             padx=20,
@@ -386,7 +510,7 @@ class JournalApp:
             command=self._open_entries_folder,
             bg="white",
             fg=COLORS["text_dark"],
-            font=("Segoe UI", 11, "bold"),
+            font=self.fonts["bold"],
             relief="flat",
             bd=0,
             padx=18,
@@ -395,64 +519,103 @@ class JournalApp:
         ).pack(side="left", padx=10)
 
     def _draw_gradient(self, width: int, height: int) -> None:
-        self.bg_canvas.delete("gradient")
-        steps = 80
-        for i in range(steps):
-            ratio = i / max(steps - 1, 1)
-            color = blend_colors(COLORS["gradient_top"], COLORS["gradient_bottom"], ratio)
-            y0 = int(height * i / steps)
-            y1 = int(height * (i + 1) / steps)
-            self.bg_canvas.create_rectangle(0, y0, width, y1, outline="", fill=color, tags="gradient")
-        self.bg_canvas.tag_lower("gradient")
+        # One color per pixel row, tiled across the width by Tk in a single put.
+        if len(self._gradient_column) != height:
+            palette = gradient_palette(COLORS["gradient_top"], COLORS["gradient_bottom"])
+            last_row = max(height - 1, 1)
+            self._gradient_column = tuple(
+                (palette[(row * 255 + last_row // 2) // last_row],) for row in range(height)
+            )
+        self._gradient_image.configure(width=width, height=height)
+        self._gradient_image.put(self._gradient_column, to=(0, 0, width, height))
+        if self._gradient_item is None:
+            self._gradient_item = self.bg_canvas.create_image(
+                0, 0, anchor="nw", image=self._gradient_image, tags="gradient"
+            )
+            self.bg_canvas.tag_lower(self._gradient_item)
 
     def _on_canvas_resize(self, event: tk.Event[tk.Canvas]) -> None:
-        self._draw_gradient(event.width, event.height)
+        # Tk fires <Configure> continuously while dragging; relayout once it settles.
+        self._canvas_size = (event.width, event.height)
+        if self._resize_job is not None:
+            self.root.after_cancel(self._resize_job)
+        self._resize_job = self.root.after(50, self._do_resize)
+
+    def _do_resize(self) -> None:
+        self._resize_job = None
+        width, height = self._canvas_size
+        self._draw_gradient(width, height)
         gap = 50
-        phone_height = min(event.height - 120, 620)
+        phone_height = min(height - 120, 620)
         phone_height = max(phone_height, 520)
         left_width = 360
         right_width = 420
         total_width = left_width + right_width + gap
-        start_x = max((event.width - total_width) / 2, 30)
-        top_y = max((event.height - phone_height) / 2, 30)
+        start_x = max((width - total_width) / 2, 30)
+        top_y = max((height - phone_height) / 2, 30)
         self.bg_canvas.coords(self.left_window, start_x, top_y)
         self.bg_canvas.coords(self.right_window, start_x + left_width + gap, top_y - 15)
-        self.bg_canvas.itemconfigure(self.left_window, width=left_width, height=phone_height)
-        self.bg_canvas.itemconfigure(self.right_window, width=right_width, height=phone_height + 30)
+        # The phone height is clamped, so most resizes only move the windows; resizing
+        # them would force Tk to relayout every widget inside both phones.
+        if phone_height != self._phone_height:
+            self._phone_height = phone_height
+            self.bg_canvas.itemconfigure(self.left_window, width=left_width, height=phone_height)
+            self.bg_canvas.itemconfigure(self.right_window, width=right_width, height=phone_height + 30)
 
     def _render_cards(self, entries: list[Path]) -> None:
-        for child in self.cards_frame.winfo_children():
-            child.destroy()
-        self.card_widgets.clear()
-        if not entries:
-            tk.Label(
-                self.cards_frame,
-                text="No entries yet. Tap New page to begin",
-                fg=COLORS["left_muted"],
-                bg=COLORS["left_bg"],
-                wraplength=240,
-            ).pack(anchor="w", pady=20)
+        shown = entries[:4]
+        shown_stems = {file.stem for file in shown}
+        for stem in [stem for stem in self.card_widgets if stem not in shown_stems]:
+            self.card_widgets.pop(stem).destroy()
+        if not shown:
+            if self._empty_cards_label is None:
+                self._empty_cards_label = tk.Label(
+                    self.cards_frame,
+                    text="No entries yet. Tap New page to begin",
+                    fg=COLORS["left_muted"],
+                    bg=COLORS["left_bg"],
+                    wraplength=240,
+                )
+                self._empty_cards_label.pack(anchor="w", pady=20)
             return
-        for idx, file in enumerate(entries[:4]):
-            color = CARD_COLORS[idx % len(CARD_COLORS)]
-            card = tk.Frame(self.cards_frame, bg=color, bd=0, highlightthickness=2, highlightbackground=color)
+        if self._empty_cards_label is not None:
+            self._empty_cards_label.destroy()
+            self._empty_cards_label = None
+        # Reuse existing cards, repacking them in order so only new dates build widgets.
+        ordered: dict[str, tk.Frame] = {}
+        for idx, file in enumerate(shown):
+            card = self.card_widgets.get(file.stem)
+            if card is None:
+                card = self._build_card(file.stem)
+            else:
+                card.pack_forget()
+            self._fill_card(card, file, CARD_COLORS[idx % len(CARD_COLORS)])
             card.pack(fill="x", pady=6)
-            try:
-                content = file.read_text(encoding="utf-8")
-            except UnicodeDecodeError:
-                content = ""
-            snippet = textwrap.shorten(content.strip().replace("\n", " "), width=90, placeholder=" ") if content.strip() else "Empty entry"
-            pretty_date = datetime.strptime(file.stem, DATE_FORMAT).strftime("%b %d")
-            tk.Label(card, text=pretty_date, font=("Segoe UI", 12, "bold"), bg=color, fg=COLORS["text_dark"]).pack(anchor="w", pady=(8, 2), padx=12)
-            tk.Label(card, text=snippet, font=("Segoe UI", 10), bg=color, fg=COLORS["text_dark"], wraplength=250, justify="left").pack(anchor="w", padx=12, pady=(0, 10))
-            card.bind("<Button-1>", lambda _e, date=file.stem: self._load_entry_by_date(date))
-            for widget in card.winfo_children():
-                widget.bind("<Button-1>", lambda _e, date=file.stem: self._load_entry_by_date(date))
-            self.card_widgets[file.stem] = card
+            ordered[file.stem] = card
+        self.card_widgets = ordered
+
+    def _build_card(self, stem: str) -> tk.Frame:
+        card = tk.Frame(self.cards_frame, bd=0, highlightthickness=2)
+        tk.Label(card, text=pretty_date(stem), font=self.fonts["card_title"], fg=COLORS["text_dark"]).pack(anchor="w", pady=(8, 2), padx=12)
+        tk.Label(card, font=self.fonts["small"], fg=COLORS["text_dark"], wraplength=250, justify="left").pack(anchor="w", padx=12, pady=(0, 10))
+        card.bind("<Button-1>", lambda _e, date=stem: self._load_entry_by_date(date))
+        for widget in card.winfo_children():
+            widget.bind("<Button-1>", lambda _e, date=stem: self._load_entry_by_date(date))
+        return card
+
+    def _fill_card(self, card: tk.Frame, file: Path, color: str) -> None:
+        # The card only shows ~90 chars, so decode just the head of the file.
+        with file.open("rb") as handle:
+            content = handle.read(SNIPPET_BYTES).decode("utf-8", errors="ignore")
+        snippet = textwrap.shorten(content.strip().replace("\n", " "), width=90, placeholder=" ") if content.strip() else "Empty entry"
+        card.configure(bg=color, highlightbackground=color)
+        date_label, snippet_label = card.winfo_children()
+        date_label.configure(bg=color)
+        snippet_label.configure(text=snippet, bg=color)
 
     def _highlight_card(self, date_text: str) -> None:
-        for date, widget in self.card_widgets.items():
-            widget.config(highlightbackground=CARD_COLORS[list(self.card_widgets).index(date) % len(CARD_COLORS)])
+        for idx, widget in enumerate(self.card_widgets.values()):
+            widget.config(highlightbackground=CARD_COLORS[idx % len(CARD_COLORS)])
         if date_text in self.card_widgets:
             self.card_widgets[date_text].config(highlightbackground=COLORS["accent"])
 
@@ -489,12 +652,16 @@ class JournalApp:
         if not content:
             messagebox.showinfo("Empty entry", "Write something before saving.")
             return
-        self._entry_path(date_obj).write_text(content, encoding="utf-8")
+        path = self._entry_path(date_obj)
+        path.write_text(content, encoding="utf-8")
+        index = bisect_left(self._entry_names, path.name)
+        if index == len(self._entry_names) or self._entry_names[index] != path.name:
+            self._entry_names.insert(index, path.name)
         self.status_var.set("Saved")
         self._load_entry_dates(select_date=date_text)
 
     def _load_entry_dates(self, select_date: str | None = None) -> None:
-        entries = sorted(ENTRY_DIR.glob("*.txt"), reverse=True)
+        entries = [ENTRY_DIR / name for name in self._entry_names[:-5:-1]]
         self._render_cards(entries)
         if select_date:
             self._load_entry_by_date(select_date)
@@ -515,27 +682,39 @@ class JournalApp:
 
     def _apply_format(self, tag: str) -> None:
         try:
-            start = self.text_widget.index("sel.first")
-            end = self.text_widget.index("sel.last")
+            self.text_widget.tag_add(tag, "sel.first", "sel.last")
         except tk.TclError:
             messagebox.showinfo("Select text", "Highlight text before applying formatting.")
             return
-        self.text_widget.tag_add(tag, start, end)
+        self._applied_tags.add(tag)
 
     def _clear_formatting(self) -> None:
-        self.text_widget.tag_remove("bold", "1.0", tk.END)
-        self.text_widget.tag_remove("italic", "1.0", tk.END)
+        # Only tags applied since the last clear can have ranges worth removing.
+        for tag in self._applied_tags:
+            self.text_widget.tag_remove(tag, "1.0", tk.END)
+        self._applied_tags.clear()
 
     def _on_text_modified(self, _event: tk.Event[tk.Text]) -> None:
         if self.text_widget.edit_modified():
-            self._update_metrics()
+            self._schedule_metrics()
             self.status_var.set("Unsaved changes")
             self.text_widget.edit_modified(False)
 
+    def _schedule_metrics(self) -> None:
+        # Coalesce bursts of keystrokes into one metrics pass.
+        if self._metrics_job is None:
+            self._metrics_job = self.root.after(150, self._flush_metrics)
+
+    def _flush_metrics(self) -> None:
+        self._metrics_job = None
+        self._update_metrics()
+
     def _update_metrics(self) -> None:
-        text = self.text_widget.get("1.0", "end-1c").strip()
-        chars = len(text)
-        words = len(text.split()) if text else 0
+        # Let Tk count in C instead of copying the whole buffer into Python.
+        widget = self.text_widget
+        chars = (widget.count("1.0", "end-1c", "chars") or (0,))[0]
+        word_starts = widget.tk.call(str(widget), "search", "-all", "-regexp", "--", r"\S+", "1.0", "end-1c")
+        words = len(widget.tk.splitlist(word_starts))
         self.metrics_var.set(f"{chars} chars  {words} words")
 
     def _refresh_prompt(self) -> None:
@@ -543,6 +722,8 @@ class JournalApp:
         self.affirmation_var.set(random.choice(AFFIRMATIONS))
 
     def _open_entries_folder(self) -> None:
+        import subprocess  # Only needed for this rare action; keep it off the startup path.
+
         path = ENTRY_DIR.resolve()
         try:
             if sys.platform.startswith("win"):
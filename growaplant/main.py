@@ -1,16 +1,28 @@
 import json
 import math
+import os
 import random
+import struct
 import time
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-import tkinter as tk
-from tkinter import messagebox
 
-STATE_FILE = Path(__file__).with_name("plant_state.json")
+# Tkinter is imported inside the UI code so the growth model, colors, and state
+# helpers can be imported without loading Tk.
+
+STATE_FILE = Path(__file__).with_name("plant_state.bin")
+LEGACY_STATE_FILE = Path(__file__).with_name("plant_state.json")
+# Fixed little-endian layout: start_time, last_watered, manual_growth.
+STATE_KEYS = ("start_time", "last_watered", "manual_growth")
+STATE_LAYOUT = struct.Struct("<ddd")
 DAY_SECONDS = 24 * 60 * 60
 WATER_BONUS = 0.8
 DISPLAY_CAP = 6.0  # Used only for progress visuals.
+FRAME_SECONDS = 0.12
+HIDDEN_POLL_MS = 500
+_last_saved = b""  # Serialized form of the state last read from or written to disk.
 
 COLORS = {
     "ink": "#050809",
@@ -53,49 +65,94 @@ STAGES = [
     },
 ]
 
+STAGE_LIMITS = tuple(stage["limit"] for stage in STAGES)
+INV_DAY = 1.0 / DAY_SECONDS
 
-def mix(color_a: str, color_b: str, factor: float) -> str:
-    """Blend two hex colors for subtle gradients."""
-    factor = max(0.0, min(1.0, factor))
+
+@lru_cache(maxsize=2048)
+def _mix_quantized(color_a: str, color_b: str, step: int) -> str:
     a = tuple(int(color_a[i : i + 2], 16) for i in (1, 3, 5))
     b = tuple(int(color_b[i : i + 2], 16) for i in (1, 3, 5))
-    blended = tuple(int(x + (y - x) * factor) for x, y in zip(a, b))
+    blended = tuple(x + (y - x) * step // 255 for x, y in zip(a, b))
     return f"#{blended[0]:02x}{blended[1]:02x}{blended[2]:02x}"
 
 
+def mix(color_a: str, color_b: str, factor: float) -> str:
+    """Blend two hex colors for subtle gradients (factor quantized to 1/255)."""
+    factor = max(0.0, min(1.0, factor))
+    return _mix_quantized(color_a, color_b, round(factor * 255))
+
+
+# The breathing cycle advances one step (~0.08 rad) per animation tick.
+PHASE_STEPS = 79
+SIN_TABLE = tuple(math.sin(math.tau * i / PHASE_STEPS) for i in range(PHASE_STEPS))
+DRIFT_TABLE = tuple(0.4 * math.sin(math.pi * i / PHASE_STEPS) for i in range(PHASE_STEPS))
+
+# Precomputed color ramps so the animation loop indexes a table instead of re-mixing hex.
+LEAF_TONES = [mix(COLORS["leaf_dim"], COLORS["leaf"], 0.4 + 0.6 * i / 255) for i in range(256)]
+GLOW_TONES = [mix("#03110c", COLORS["leaf"], 0.2 + 0.4 * i / 255) for i in range(256)]
+
+
+def _serialize(state) -> bytes:
+    return STATE_LAYOUT.pack(*(float(state[key]) for key in STATE_KEYS))
+
+
+def _load_legacy_state():
+    """Read the JSON save used by earlier versions so progress carries over."""
+    try:
+        with LEGACY_STATE_FILE.open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if set(STATE_KEYS) <= data.keys():
+        return {key: float(data[key]) for key in STATE_KEYS}
+    return None
+
+
 def load_state():
     """Load plant data from disk or create a fresh record."""
-    if STATE_FILE.exists():
-        try:
-            with STATE_FILE.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
-                if {"start_time", "last_watered", "manual_growth"} <= data.keys():
-                    return data
-        except (OSError, ValueError):
-            pass
-
-    now = time.time()
-    data = {"start_time": now, "last_watered": 0, "manual_growth": 0.0}
+    global _last_saved
+    try:
+        payload = STATE_FILE.read_bytes()
+        data = dict(zip(STATE_KEYS, STATE_LAYOUT.unpack(payload)))
+    except (OSError, struct.error):
+        data = _load_legacy_state()
+    else:
+        _last_saved = payload
+        return data
+
+    if data is None:
+        data = {"start_time": time.time(), "last_watered": 0.0, "manual_growth": 0.0}
     save_state(data)
     return data
 
 
 def save_state(state):
-    STATE_FILE.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    """Atomically persist the state, skipping the write when nothing changed."""
+    global _last_saved
+    payload = _serialize(state)
+    if payload == _last_saved:
+        return
+    temp_file = STATE_FILE.with_suffix(".tmp")
+    temp_file.write_bytes(payload)
+    os.replace(temp_file, STATE_FILE)
+    _last_saved = payload
 
 
 def growth_points(state):
     """Blend passive time-based growth with gentle boosts from watering."""
-    elapsed_days = (time.time() - state["start_time"]) / DAY_SECONDS
+    elapsed_days = (time.time() - state["start_time"]) * INV_DAY
     passive_growth = max(0.0, elapsed_days * 0.6)
-    return passive_growth + float(state.get("manual_growth", 0.0))
+    return passive_growth + float(state["manual_growth"])
+
+
+def stage_index(points):
+    """Index of the first stage whose limit is above ``points``."""
+    return min(bisect_right(STAGE_LIMITS, points), len(STAGES) - 1)
 
 
 def pick_stage(points):
-    for stage in STAGES:
-        if points < stage["limit"]:
-            return stage
-    return STAGES[-1]
+    return STAGES[stage_index(points)]
 
 
 def format_timestamp(ts):
@@ -109,6 +166,8 @@ class PlantScene:
     """Animated canvas that keeps the experience from feeling static."""
 
     def __init__(self, master):
+        import tkinter as tk
+
         self.canvas = tk.Canvas(
             master,
             width=420,
@@ -119,25 +178,22 @@ class PlantScene:
         self.canvas.pack(pady=(12, 20))
         self.base_y = 212
         self.center_x = 210
-        self.breath_phase = 0.0
+        self.phase_index = 0
         self.fireflies = []
         self.leaf_pairs = []
+        self._glow_index = None
         self._build_layers()
 
     def _build_layers(self):
-        gradient_steps = 26
-        for step in range(gradient_steps):
-            ratio = step / gradient_steps
-            color = mix(COLORS["canvas"], COLORS["deep"], ratio)
-            y = (self.canvas.winfo_reqheight() / gradient_steps) * step
-            self.canvas.create_rectangle(
-                0,
-                y,
-                self.canvas.winfo_reqwidth(),
-                y + (self.canvas.winfo_reqheight() / gradient_steps),
-                fill=color,
-                outline="",
-            )
+        import tkinter as tk
+
+        # Bake the background into one image: a column of per-row colors tiled across.
+        width = self.canvas.winfo_reqwidth()
+        height = self.canvas.winfo_reqheight()
+        column = tuple((mix(COLORS["canvas"], COLORS["deep"], row / height),) for row in range(height))
+        self.background = tk.PhotoImage(master=self.canvas, width=width, height=height)
+        self.background.put(column, to=(0, 0, width, height))
+        self.canvas.create_image(0, 0, anchor="nw", image=self.background)
 
         self.glow = self.canvas.create_oval(0, 0, 0, 0, fill="#08251b", outline="")
 
@@ -177,6 +233,8 @@ class PlantScene:
             left = self.canvas.create_polygon(0, 0, 0, 0, 0, 0, fill=COLORS["leaf"], outline="")
             right = self.canvas.create_polygon(0, 0, 0, 0, 0, 0, fill=COLORS["leaf"], outline="")
             self.leaf_pairs.append((left, right))
+        # Each leaf pair sways one radian ahead of the previous one.
+        self.leaf_phase_offsets = [round(idx * PHASE_STEPS / math.tau) for idx in range(len(self.leaf_pairs))]
 
         self.flower = self.canvas.create_oval(0, 0, 0, 0, fill=COLORS["accent"], outline="", state="hidden")
 
@@ -189,7 +247,7 @@ class PlantScene:
         size = random.uniform(2.0, 4.0)
         color = random.choice([COLORS["accent"], COLORS["accent_dim"], "#4fd29b"])
         item = self.canvas.create_oval(x, y, x + size, y + size, fill=color, outline="")
-        self.fireflies.append({"id": item, "speed": random.uniform(0.2, 0.7)})
+        self.fireflies.append({"id": item, "x": float(x), "y": float(y), "size": size, "speed": random.uniform(0.2, 0.7)})
 
     def render(self, stage_index: int, stage_ratio: float):
         stage_ratio = max(0.0, min(1.0, stage_ratio))
@@ -203,10 +261,11 @@ class PlantScene:
         )
 
         visible_pairs = min(stage_index, len(self.leaf_pairs))
+        color = LEAF_TONES[int(stage_ratio * 255)]
         for idx, (left, right) in enumerate(self.leaf_pairs):
             y = self.base_y - (40 + idx * 32 + stage_ratio * 10)
             spread = 28 + idx * 12 + stage_ratio * 8
-            sway = 6 * math.sin(self.breath_phase + idx)
+            sway = 6 * SIN_TABLE[(self.phase_index + self.leaf_phase_offsets[idx]) % PHASE_STEPS]
 
             left_coords = [
                 self.center_x,
@@ -226,7 +285,6 @@ class PlantScene:
             ]
             for item, coords in ((left, left_coords), (right, right_coords)):
                 self.canvas.coords(item, *coords)
-                color = mix(COLORS["leaf_dim"], COLORS["leaf"], 0.4 + 0.6 * stage_ratio)
                 self.canvas.itemconfigure(item, fill=color)
                 state = "normal" if idx < visible_pairs else "hidden"
                 self.canvas.itemconfigure(item, state=state)
@@ -246,8 +304,9 @@ class PlantScene:
             self.canvas.itemconfigure(self.flower, state="hidden")
 
     def animate(self):
-        self.breath_phase = (self.breath_phase + 0.08) % (math.pi * 2)
-        glow_radius = 150 + 12 * math.sin(self.breath_phase)
+        self.phase_index = (self.phase_index + 1) % PHASE_STEPS
+        wave = SIN_TABLE[self.phase_index]
+        glow_radius = 150 + 12 * wave
         self.canvas.coords(
             self.glow,
             self.center_x - glow_radius,
@@ -255,17 +314,21 @@ class PlantScene:
             self.center_x + glow_radius,
             self.base_y + glow_radius * 0.25,
         )
-        glow_color = mix("#03110c", COLORS["leaf"], 0.4 + 0.2 * math.sin(self.breath_phase))
-        self.canvas.itemconfigure(self.glow, fill=glow_color)
+        glow_index = int((wave + 1) * 127.5)
+        if glow_index != self._glow_index:
+            self._glow_index = glow_index
+            self.canvas.itemconfigure(self.glow, fill=GLOW_TONES[glow_index])
 
+        # Firefly positions live in Python so each one costs a single coords() call.
+        drift_x = DRIFT_TABLE[self.phase_index]
         for data in self.fireflies:
-            drift_x = math.sin(self.breath_phase * 0.5) * 0.4
-            self.canvas.move(data["id"], drift_x, -data["speed"])
-            x1, y1, x2, y2 = self.canvas.coords(data["id"])
-            if y2 < -5:
-                reset_y = self.base_y + random.randint(30, 120)
-                delta_x = random.randint(-160, 160)
-                self.canvas.move(data["id"], delta_x, reset_y - y1)
+            data["x"] += drift_x
+            data["y"] -= data["speed"]
+            if data["y"] + data["size"] < -5:
+                data["x"] += random.randint(-160, 160)
+                data["y"] = self.base_y + random.randint(30, 120)
+            x, y, size = data["x"], data["y"], data["size"]
+            self.canvas.coords(data["id"], x, y, x + size, y + size)
 
 
 class PlantApp:
@@ -278,12 +341,16 @@ class PlantApp:
         self.state = load_state()
 
         self.scene = None
+        self._render_key = None
         self._build_ui()
         self._update_ui()
         self.root.after(5000, self._heartbeat)
-        self.root.after(120, self._animate_scene)
+        self._next_frame = time.monotonic() + FRAME_SECONDS
+        self.root.after(int(FRAME_SECONDS * 1000), self._animate_scene)
 
     def _build_ui(self):
+        import tkinter as tk
+
         self.wrapper = tk.Frame(self.root, bg=COLORS["ink"])
         self.wrapper.pack(fill="both", expand=True)
 
@@ -406,6 +473,8 @@ class PlantApp:
     def water_plant(self):
         now = time.time()
         if now - self.state["last_watered"] < DAY_SECONDS:
+            from tkinter import messagebox
+
             remaining = DAY_SECONDS - (now - self.state["last_watered"])
             hours = int(remaining // 3600)
             minutes = int((remaining % 3600) // 60)
@@ -416,7 +485,7 @@ class PlantApp:
             return
 
         self.state["last_watered"] = now
-        self.state["manual_growth"] = float(self.state.get("manual_growth", 0.0)) + WATER_BONUS
+        self.state["manual_growth"] = float(self.state["manual_growth"]) + WATER_BONUS
         save_state(self.state)
         self.status_label.config(text="Your plant happily soaks up the water.")
         self._update_ui()
@@ -426,14 +495,26 @@ class PlantApp:
         self.root.after(5000, self._heartbeat)
 
     def _animate_scene(self):
+        now = time.monotonic()
+        if not self.root.winfo_viewable():
+            # Nothing to see while minimized; poll slowly until the window returns.
+            self._next_frame = now + FRAME_SECONDS
+            self.root.after(HIDDEN_POLL_MS, self._animate_scene)
+            return
         self.scene.animate()
-        self.root.after(120, self._animate_scene)
+        # Hold a steady cadence by subtracting the frame's own cost; if we fell
+        # behind, drop the missed frames instead of firing them back to back.
+        self._next_frame += FRAME_SECONDS
+        if self._next_frame < now:
+            self._next_frame = now + FRAME_SECONDS
+        delay = max(1, int((self._next_frame - time.monotonic()) * 1000))
+        self.root.after(delay, self._animate_scene)
 
     def _update_ui(self):
         points = growth_points(self.state)
-        stage = pick_stage(points)
-        stage_index = STAGES.index(stage)
-        prev_limit = STAGES[stage_index - 1]["limit"] if stage_index else 0.0
+        current = stage_index(points)
+        stage = STAGES[current]
+        prev_limit = STAGE_LIMITS[current - 1] if current else 0.0
         span = stage["limit"] - prev_limit if math.isfinite(stage["limit"]) else 1.0
         stage_ratio = 1.0 if not math.isfinite(stage["limit"]) else max(0.0, min(1.0, (points - prev_limit) / max(0.001, span)))
 
@@ -442,11 +523,12 @@ class PlantApp:
         self.progress_canvas.coords(self.progress_fill, 12, 12, fill_width, 40)
         self.progress_canvas.itemconfigure(self.progress_text, text=f"{points:.1f} growth points")
 
-        passive = max(0.0, points - float(self.state.get("manual_growth", 0.0)))
+        manual_growth = float(self.state["manual_growth"])
+        passive = max(0.0, points - manual_growth)
         self.metrics_label.config(
             text=(
                 f"Passive glow   : {passive:.1f}\n"
-                f"Water bonuses : {self.state.get('manual_growth', 0.0):.1f}\n"
+                f"Water bonuses : {manual_growth:.1f}\n"
                 f"Daily limit    : 1 sip / 24h"
             )
         )
@@ -457,10 +539,16 @@ class PlantApp:
         if not self.status_label.cget("text"):
             self.status_label.config(text="Water gently once per day to keep the glow steady.")
 
-        self.scene.render(stage_index, stage_ratio)
+        # Growth creeps slowly, so most heartbeats leave the plant geometry untouched.
+        render_key = (current, round(stage_ratio, 3))
+        if render_key != self._render_key:
+            self._render_key = render_key
+            self.scene.render(current, stage_ratio)
 
 
 def main():
+    import tkinter as tk
+
     root = tk.Tk()
     PlantApp(root)
     root.mainloop()
@@ -1,23 +1,53 @@
 """Base class shared by all arcade games."""
 from __future__ import annotations
 
-from typing import Iterable
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Sequence
 
 import pygame
 
+from .. import settings
+
+
+@contextmanager
+def locked_surface(surface: pygame.Surface) -> Iterator[pygame.Surface]:
+    """Hold one lock across a batch of pygame.draw calls; blits must happen outside."""
+    surface.lock()
+    try:
+        yield surface
+    finally:
+        surface.unlock()
+
 
 class BaseGame:
     """Simple template that exposes the methods the arcade expects."""
 
     EXIT_KEYS = {pygame.K_ESCAPE, pygame.K_BACKSPACE}
+    KEYS_UP = (pygame.K_w, pygame.K_UP)
+    KEYS_DOWN = (pygame.K_s, pygame.K_DOWN)
+    KEYS_LEFT = (pygame.K_a, pygame.K_LEFT)
+    KEYS_RIGHT = (pygame.K_d, pygame.K_RIGHT)
+    _fonts: tuple[pygame.font.Font, pygame.font.Font] | None = None
+    # Class-level so the menu can describe a game without constructing it.
+    name = ""
+    instructions = ""
 
-    def __init__(self, name: str, instructions: str) -> None:
-        self.name = name
-        self.instructions = instructions
-        self.primary_font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 24)
+    def __init__(self) -> None:
+        # Shared playfield rect for clamp_ip calls so games don't rebuild it every frame.
+        self.bounds = pygame.Rect(0, 0, settings.WIDTH, settings.HEIGHT)
+        self.primary_font, self.small_font = self._shared_fonts()
+        self._text_cache: dict[str, pygame.Surface] = {}
+        self._hud_cache: dict[str, tuple[str, pygame.Surface]] = {}
+        self._glyphs: dict[tuple[pygame.font.Font, tuple[int, int, int]], dict[str, pygame.Surface]] = {}
         self.reset()
 
+    @staticmethod
+    def _shared_fonts() -> tuple[pygame.font.Font, pygame.font.Font]:
+        """Load the default fonts once and share them between every game."""
+        if BaseGame._fonts is None:
+            BaseGame._fonts = (pygame.font.Font(None, 32), pygame.font.Font(None, 24))
+        return BaseGame._fonts
+
     def reset(self) -> None:  # pragma: no cover - runtime behavior
         raise NotImplementedError
 
@@ -32,12 +62,51 @@ class BaseGame:
     def process_events(self, events: Iterable[pygame.event.Event]) -> None:
         """Hook for subclasses to consume events after exit keys were handled."""
 
+    @staticmethod
+    def read_axis(keys: Sequence[bool], negative: tuple[int, ...], positive: tuple[int, ...]) -> int:
+        """Return -1, 0 or 1 from the pressed state of two opposing key groups."""
+        return any(map(keys.__getitem__, positive)) - any(map(keys.__getitem__, negative))
+
     def update(self, dt: float) -> None:  # pragma: no cover - runtime behavior
         raise NotImplementedError
 
     def draw(self, surface: pygame.Surface) -> None:  # pragma: no cover
         raise NotImplementedError
 
+    def render_hud(
+        self,
+        slot: str,
+        font: pygame.font.Font,
+        text: str,
+        color: tuple[int, int, int],
+    ) -> pygame.Surface:
+        """Return the surface for a HUD slot, re-rendering only when its text changes."""
+        cached = self._hud_cache.get(slot)
+        if cached is None or cached[0] != text:
+            # Match the display format once here so per-frame blits skip conversion.
+            cached = self._hud_cache[slot] = (text, font.render(text, True, color).convert_alpha())
+        return cached[1]
+
+    def draw_glyphs(
+        self,
+        surface: pygame.Surface,
+        font: pygame.font.Font,
+        text: str,
+        color: tuple[int, int, int],
+        pos: tuple[int, int],
+    ) -> None:
+        """Blit text from cached per-character surfaces, for counters that change every few frames."""
+        glyphs = self._glyphs.setdefault((font, color), {})
+        x, y = pos
+        batch = []
+        for char in text:
+            glyph = glyphs.get(char)
+            if glyph is None:
+                glyph = glyphs[char] = font.render(char, True, color).convert_alpha()
+            batch.append((glyph, (x, y)))
+            x += glyph.get_width()
+        surface.blits(batch, doreturn=False)
+
     def draw_instruction_text(
         self,
         surface: pygame.Surface,
@@ -47,8 +116,22 @@ class BaseGame:
         y: int = 10,
     ) -> None:
         """Render helper used by several mini games."""
+        block = self._text_cache.get(text)
+        if block is None:
+            block = self._text_cache[text] = self._render_text_block(text)
+        surface.blit(block, (x, y))
+
+    def _render_text_block(self, text: str) -> pygame.Surface:
+        color = (230, 234, 244)
         lines = [line.strip() for line in text.splitlines() if line.strip()]
-        for line in lines:
-            rendered = self.small_font.render(line, True, (230, 234, 244))
-            surface.blit(rendered, (x, y))
-            y += rendered.get_height() + 4
+        rendered = [self.small_font.render(line, True, color) for line in lines]
+        width = max((line.get_width() for line in rendered), default=0)
+        height = sum(line.get_height() + 4 for line in rendered)
+        block = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        # Clear to the text color at zero alpha so antialiased edges keep their tint.
+        block.fill((*color, 0))
+        y = 0
+        for line in rendered:
+            block.blit(line, (0, y))
+            y += line.get_height() + 4
+        return block
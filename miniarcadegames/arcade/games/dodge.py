@@ -7,19 +7,26 @@ from typing import Iterable
 import pygame
 
 from .. import settings
-from .base_game import BaseGame
+from .base_game import BaseGame, locked_surface
+
+DIAGONAL_SCALE = 0.7071067811865476  # 1 / sqrt(2)
 
 
 class DodgeGame(BaseGame):
     """Stay alive by dodging randomly falling blocks."""
 
+    name = "Dodge"
+    instructions = (
+        "Move with WASD or the arrow keys.\n"
+        "Survive as long as possible without touching a block.\n"
+        "Enter restarts after a crash, Esc/Backspace exits."
+    )
+
     def __init__(self) -> None:
-        instructions = (
-            "Move with WASD or the arrow keys.\n"
-            "Survive as long as possible without touching a block.\n"
-            "Enter restarts after a crash, Esc/Backspace exits."
-        )
-        super().__init__("Dodge", instructions)
+        super().__init__()
+        self._overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT)).convert()
+        self._overlay.fill((0, 0, 0))
+        self._overlay.set_alpha(160)
 
     def reset(self) -> None:
         self.player = pygame.Rect(settings.WIDTH // 2 - 18, settings.HEIGHT - 70, 36, 36)
@@ -39,15 +46,15 @@ class DodgeGame(BaseGame):
 
     def update(self, dt: float) -> None:
         keys = pygame.key.get_pressed()
-        move = pygame.Vector2(
-            (keys[pygame.K_d] or keys[pygame.K_RIGHT]) - (keys[pygame.K_a] or keys[pygame.K_LEFT]),
-            (keys[pygame.K_s] or keys[pygame.K_DOWN]) - (keys[pygame.K_w] or keys[pygame.K_UP]),
-        )
-        if move.length_squared() > 0:
-            move = move.normalize()
-        self.player.x += int(move.x * self.speed * dt)
-        self.player.y += int(move.y * self.speed * dt)
-        self.player.clamp_ip(pygame.Rect(0, 0, settings.WIDTH, settings.HEIGHT))
+        dx = self.read_axis(keys, self.KEYS_LEFT, self.KEYS_RIGHT)
+        dy = self.read_axis(keys, self.KEYS_UP, self.KEYS_DOWN)
+        step = self.speed * dt
+        if dx and dy:
+            # Keep diagonal movement at the same speed as straight movement.
+            step *= DIAGONAL_SCALE
+        self.player.x += int(dx * step)
+        self.player.y += int(dy * step)
+        self.player.clamp_ip(self.bounds)
 
         if self.game_over:
             return
@@ -60,27 +67,34 @@ class DodgeGame(BaseGame):
             # Slowly ramp the difficulty by shrinking the delay each spawn.
             self.spawn_delay = max(0.35, self.spawn_delay * 0.98)
 
-        for idx, obstacle in list(enumerate(self.obstacles)):
-            obstacle.y += int(self.obstacle_speeds[idx] * dt)
+        # Walk backwards and swap-remove so culling never shifts the lists.
+        obstacles = self.obstacles
+        speeds = self.obstacle_speeds
+        for idx in range(len(obstacles) - 1, -1, -1):
+            obstacle = obstacles[idx]
+            obstacle.y += int(speeds[idx] * dt)
             if obstacle.top > settings.HEIGHT:
-                self.obstacles.pop(idx)
-                self.obstacle_speeds.pop(idx)
+                obstacles[idx] = obstacles[-1]
+                speeds[idx] = speeds[-1]
+                obstacles.pop()
+                speeds.pop()
 
-        for obstacle in self.obstacles:
-            if obstacle.colliderect(self.player):
-                self.game_over = True
-                self.best_time = max(self.best_time, self.elapsed)
-                break
+        if self.player.collidelist(obstacles) != -1:
+            self.game_over = True
+            self.best_time = max(self.best_time, self.elapsed)
 
     def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(settings.get_color("panel"))
-        pygame.draw.rect(surface, settings.get_color("accent"), self.player, border_radius=6)
-        for obstacle in self.obstacles:
-            pygame.draw.rect(surface, settings.get_color("danger"), obstacle, border_radius=4)
-
-        hud = self.primary_font.render(f"Time: {self.elapsed:0.1f}s", True, settings.get_color("text"))
-        surface.blit(hud, (20, 20))
-        best = self.small_font.render(f"Best: {self.best_time:0.1f}s", True, settings.get_color("muted"))
+        surface.fill(settings.PANEL)
+        with locked_surface(surface):
+            pygame.draw.rect(surface, settings.ACCENT, self.player, border_radius=6)
+            for obstacle in self.obstacles:
+                pygame.draw.rect(surface, settings.DANGER, obstacle, border_radius=4)
+
+        # The timer changes ten times a second, so its digits come from the glyph cache.
+        label = self.render_hud("time", self.primary_font, "Time: ", settings.TEXT)
+        surface.blit(label, (20, 20))
+        self.draw_glyphs(surface, self.primary_font, f"{self.elapsed:0.1f}s", settings.TEXT, (20 + label.get_width(), 20))
+        best = self.render_hud("best", self.small_font, f"Best: {self.best_time:0.1f}s", settings.MUTED)
         surface.blit(best, (20, 60))
 
         if self.game_over:
@@ -97,8 +111,6 @@ class DodgeGame(BaseGame):
         self.obstacle_speeds.append(speed)
 
     def _draw_game_over(self, surface: pygame.Surface) -> None:
-        overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        surface.blit(overlay, (0, 0))
-        text = self.primary_font.render("Hit! Press Enter to retry", True, settings.get_color("danger"))
+        surface.blit(self._overlay, (0, 0))
+        text = self.render_hud("hit", self.primary_font, "Hit! Press Enter to retry", settings.DANGER)
         surface.blit(text, text.get_rect(center=(settings.WIDTH // 2, settings.HEIGHT // 2)))
@@ -1,31 +1,35 @@
 """Minimal Pong variant."""
 from __future__ import annotations
 
+import math
 import random
 from typing import Iterable
 
 import pygame
 
 from .. import settings
-from .base_game import BaseGame
+from .base_game import BaseGame, locked_surface
 
 
 class PongGame(BaseGame):
     """Single-player Pong versus a simple AI paddle."""
 
-    def __init__(self) -> None:
-        instructions = (
-            "Move with W/S or the arrow keys.\n"
-            "First to 7 points wins the round.\n"
-            "Esc/Backspace returns to the menu."
-        )
-        super().__init__("Pong", instructions)
+    name = "Pong"
+    instructions = (
+        "Move with W/S or the arrow keys.\n"
+        "First to 7 points wins the round.\n"
+        "Esc/Backspace returns to the menu."
+    )
 
     def reset(self) -> None:
         self.player = pygame.Rect(40, settings.HEIGHT // 2 - 45, 14, 90)
         self.ai = pygame.Rect(settings.WIDTH - 54, settings.HEIGHT // 2 - 45, 14, 90)
         self.ball = pygame.Rect(settings.WIDTH // 2 - 10, settings.HEIGHT // 2 - 10, 20, 20)
-        self.ball_velocity = pygame.Vector2(0, 0)
+        # Ball position and velocity are kept as floats; the rect is synced from them.
+        self.ball_x = float(self.ball.x)
+        self.ball_y = float(self.ball.y)
+        self.ball_vx = 0.0
+        self.ball_vy = 0.0
         self.ball_speed = 360
         self.player_speed = 420
         self.ai_speed = 380
@@ -42,13 +46,9 @@ class PongGame(BaseGame):
 
     def update(self, dt: float) -> None:
         keys = pygame.key.get_pressed()
-        move_dir = 0
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            move_dir -= 1
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            move_dir += 1
+        move_dir = self.read_axis(keys, self.KEYS_UP, self.KEYS_DOWN)
         self.player.y += move_dir * self.player_speed * dt
-        self.player.clamp_ip(pygame.Rect(0, 0, settings.WIDTH, settings.HEIGHT))
+        self.player.clamp_ip(self.bounds)
 
         if self.round_over:
             self.round_cooldown -= dt
@@ -59,32 +59,36 @@ class PongGame(BaseGame):
             self._move_ai(dt)
 
     def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(settings.get_color("background"))
-        pygame.draw.rect(surface, settings.get_color("panel"), pygame.Rect(settings.WIDTH // 2 - 2, 0, 4, settings.HEIGHT))
-        pygame.draw.ellipse(surface, settings.get_color("accent_alt"), self.ball)
-        pygame.draw.rect(surface, settings.get_color("accent"), self.player)
-        pygame.draw.rect(surface, settings.get_color("muted"), self.ai)
-
-        hud = self.primary_font.render(f"{self.player_score} : {self.ai_score}", True, settings.get_color("text"))
+        surface.fill(settings.BACKGROUND)
+        with locked_surface(surface):
+            pygame.draw.rect(surface, settings.PANEL, pygame.Rect(settings.WIDTH // 2 - 2, 0, 4, settings.HEIGHT))
+            pygame.draw.ellipse(surface, settings.ACCENT_ALT, self.ball)
+            pygame.draw.rect(surface, settings.ACCENT, self.player)
+            pygame.draw.rect(surface, settings.MUTED, self.ai)
+
+        hud = self.render_hud("score", self.primary_font, f"{self.player_score} : {self.ai_score}", settings.TEXT)
         surface.blit(hud, hud.get_rect(center=(settings.WIDTH // 2, 40)))
 
         if self.round_over:
-            info = self.small_font.render("Press Enter to serve", True, settings.get_color("muted"))
+            info = self.render_hud("serve", self.small_font, "Press Enter to serve", settings.MUTED)
             surface.blit(info, info.get_rect(center=(settings.WIDTH // 2, settings.HEIGHT // 2)))
 
         self.draw_instruction_text(surface, self.instructions, x=16, y=settings.HEIGHT - 120)
 
     def _move_ball(self, dt: float) -> None:
-        self.ball.x += int(self.ball_velocity.x * dt)
-        self.ball.y += int(self.ball_velocity.y * dt)
+        self.ball_x += self.ball_vx * dt
+        self.ball_y += self.ball_vy * dt
+        self.ball.x = int(self.ball_x)
+        self.ball.y = int(self.ball_y)
 
         if self.ball.top <= 0 or self.ball.bottom >= settings.HEIGHT:
-            self.ball_velocity.y *= -1
-            self.ball.clamp_ip(pygame.Rect(0, 0, settings.WIDTH, settings.HEIGHT))
+            self.ball_vy = -self.ball_vy
+            self.ball.clamp_ip(self.bounds)
+            self.ball_y = float(self.ball.y)
 
-        if self.ball.colliderect(self.player) and self.ball_velocity.x < 0:
+        if self.ball.colliderect(self.player) and self.ball_vx < 0:
             self._bounce_off_paddle(self.player)
-        elif self.ball.colliderect(self.ai) and self.ball_velocity.x > 0:
+        elif self.ball.colliderect(self.ai) and self.ball_vx > 0:
             self._bounce_off_paddle(self.ai)
 
         if self.ball.right < 0:
@@ -105,34 +109,39 @@ class PongGame(BaseGame):
             self.ai.y -= self.ai_speed * dt
         elif target > self.ai.centery + 10:
             self.ai.y += self.ai_speed * dt
-        self.ai.clamp_ip(pygame.Rect(0, 0, settings.WIDTH, settings.HEIGHT))
+        self.ai.clamp_ip(self.bounds)
 
     def _bounce_off_paddle(self, paddle: pygame.Rect) -> None:
         # Offset controls the reflection angle so hitting near edges changes trajectory.
         offset = (self.ball.centery - paddle.centery) / (paddle.height / 2)
         speed = self.ball_speed * 1.05
-        self.ball_velocity.x *= -1
-        self.ball_velocity.y = speed * offset
-        self.ball_velocity.scale_to_length(speed)
+        vx = -self.ball_vx
+        vy = speed * offset
+        scale = speed / math.hypot(vx, vy)
+        self.ball_vx = vx * scale
+        self.ball_vy = vy * scale
 
         if paddle is self.player:
             self.ball.left = paddle.right + 1
         else:
             self.ball.right = paddle.left - 1
+        self.ball_x = float(self.ball.x)
 
     def _end_round(self, *, direction: int) -> None:
         self.round_over = True
         self.round_cooldown = 1.2
         self.pending_direction = direction
         self.ball.center = (settings.WIDTH // 2, settings.HEIGHT // 2)
-        self.ball_velocity.update(0, 0)
+        self.ball_x = float(self.ball.x)
+        self.ball_y = float(self.ball.y)
+        self.ball_vx = 0.0
+        self.ball_vy = 0.0
 
     def _serve_ball(self) -> None:
         self.round_over = False
         self.round_cooldown = 0
         angle = random.uniform(-0.5, 0.5)
         direction = self.pending_direction or random.choice((-1, 1))
-        velocity = pygame.Vector2(direction, angle)
-        velocity.scale_to_length(self.ball_speed)
-        self.ball_velocity = velocity
-
+        scale = self.ball_speed / math.hypot(direction, angle)
+        self.ball_vx = direction * scale
+        self.ball_vy = angle * scale
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import random
+from collections import deque
 from typing import Iterable
 
 import pygame
@@ -9,26 +10,45 @@ import pygame
 from .. import settings
 from .base_game import BaseGame
 
+Cell = tuple[int, int]
+
+DIRECTIONS: dict[int, Cell] = {
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+}
+
 
 class SnakeGame(BaseGame):
     """Classic grid-based snake."""
 
+    name = "Snake"
+    instructions = (
+        "Grow the snake by eating the glowing squares.\n"
+        "Arrow keys turn, Enter restarts after a crash.\n"
+        "Press Esc or Backspace to return to the menu."
+    )
+
     def __init__(self) -> None:
-        instructions = (
-            "Grow the snake by eating the glowing squares.\n"
-            "Arrow keys turn, Enter restarts after a crash.\n"
-            "Press Esc or Backspace to return to the menu."
-        )
-        super().__init__("Snake", instructions)
+        self._grid_cache: pygame.Surface | None = None
+        self._cells: tuple[pygame.Surface, pygame.Surface, pygame.Surface] | None = None
+        self._crash_overlay: pygame.Surface | None = None
+        super().__init__()
 
     def reset(self) -> None:
         self.grid = 20
         self.cols = settings.WIDTH // self.grid
         self.rows = settings.HEIGHT // self.grid
-        center = pygame.Vector2(self.cols // 2, self.rows // 2)
-        self.body: list[pygame.Vector2] = [center - pygame.Vector2(i, 0) for i in range(4)]
-        self.direction = pygame.Vector2(1, 0)
-        self.next_direction = pygame.Vector2(1, 0)
+        center_x, center_y = self.cols // 2, self.rows // 2
+        # Cells are plain (x, y) int tuples; the occupancy bitmap (one byte per cell,
+        # row-major) mirrors the deque for O(1) hit tests and apple placement.
+        self.body: deque[Cell] = deque((center_x - i, center_y) for i in range(4))
+        self.occupancy = bytearray(self.cols * self.rows)
+        for x, y in self.body:
+            self.occupancy[y * self.cols + x] = 1
+        self.direction: Cell = (1, 0)
+        self.next_direction: Cell = (1, 0)
         self.apple = self._random_cell()
         self.move_timer = 0.0
         self.move_delay = 0.12
@@ -40,18 +60,14 @@ class SnakeGame(BaseGame):
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RETURN and self.game_over:
                     self.reset()
-                elif event.key in (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT) and not self.game_over:
+                elif event.key in DIRECTIONS and not self.game_over:
                     self._queue_direction(event.key)
 
     def _queue_direction(self, key: int) -> None:
-        mapping = {
-            pygame.K_UP: pygame.Vector2(0, -1),
-            pygame.K_DOWN: pygame.Vector2(0, 1),
-            pygame.K_LEFT: pygame.Vector2(-1, 0),
-            pygame.K_RIGHT: pygame.Vector2(1, 0),
-        }
-        new_dir = mapping[key]
-        if len(self.body) <= 1 or self.body[0] + new_dir != self.body[1]:
+        new_dir = DIRECTIONS[key]
+        # Refuse a U-turn: the body always trails directly behind the current heading.
+        dx, dy = self.direction
+        if new_dir != (-dx, -dy):
             self.next_direction = new_dir
 
     def update(self, dt: float) -> None:
@@ -62,28 +78,31 @@ class SnakeGame(BaseGame):
         if self.move_timer >= self.move_delay:
             self.move_timer -= self.move_delay
             self.direction = self.next_direction
-            new_head = self.body[0] + self.direction
-            if self._hits_wall(new_head) or new_head in self.body:
+            head_x, head_y = self.body[0]
+            new_head = (head_x + self.direction[0], head_y + self.direction[1])
+            if self._hits_wall(new_head) or self.occupancy[new_head[1] * self.cols + new_head[0]]:
                 self.game_over = True
                 return
-            self.body.insert(0, new_head)
+            self.body.appendleft(new_head)
+            self.occupancy[new_head[1] * self.cols + new_head[0]] = 1
             if new_head == self.apple:
                 self.score += 1
                 self.apple = self._random_cell()
             else:
-                self.body.pop()
+                tail_x, tail_y = self.body.pop()
+                self.occupancy[tail_y * self.cols + tail_x] = 0
 
     def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(settings.get_color("background"))
-        self._draw_grid(surface)
-        for index, segment in enumerate(self.body):
-            color = settings.get_color("accent") if index == 0 else settings.get_color("accent_alt")
-            rect = pygame.Rect(segment.x * self.grid, segment.y * self.grid, self.grid, self.grid)
-            pygame.draw.rect(surface, color, rect)
-        apple_rect = pygame.Rect(self.apple.x * self.grid, self.apple.y * self.grid, self.grid, self.grid)
-        pygame.draw.rect(surface, settings.get_color("success"), apple_rect)
-
-        score_text = self.primary_font.render(f"Score: {self.score}", True, settings.get_color("text"))
+        surface.blit(self._grid_surface(), (0, 0))
+        # Submit every cell in one blits() call using pre-filled cell sprites.
+        head, body, apple = self._cell_sprites()
+        grid = self.grid
+        cells = [(body, (x * grid, y * grid)) for x, y in self.body]
+        cells[0] = (head, cells[0][1])
+        cells.append((apple, (self.apple[0] * grid, self.apple[1] * grid)))
+        surface.blits(cells, doreturn=False)
+
+        score_text = self.render_hud("score", self.primary_font, f"Score: {self.score}", settings.TEXT)
         surface.blit(score_text, (16, 12))
 
         if self.game_over:
@@ -91,29 +110,59 @@ class SnakeGame(BaseGame):
 
         self.draw_instruction_text(surface, self.instructions, x=16, y=settings.HEIGHT - 120)
 
-    def _draw_grid(self, surface: pygame.Surface) -> None:
-        line_color = settings.get_color("panel")
-        for x in range(0, settings.WIDTH, self.grid):
-            pygame.draw.line(surface, line_color, (x, 0), (x, settings.HEIGHT), 1)
-        for y in range(0, settings.HEIGHT, self.grid):
-            pygame.draw.line(surface, line_color, (0, y), (settings.WIDTH, y), 1)
+    def _grid_surface(self) -> pygame.Surface:
+        """Background plus grid lines, rasterized once on first draw."""
+        if self._grid_cache is None:
+            self._grid_cache = self._build_grid()
+        return self._grid_cache
+
+    def _cell_sprites(self) -> tuple[pygame.Surface, pygame.Surface, pygame.Surface]:
+        """Solid head, body, and apple cells, created once on first draw."""
+        if self._cells is None:
+            sprites = []
+            for color in (settings.ACCENT, settings.ACCENT_ALT, settings.SUCCESS):
+                cell = pygame.Surface((self.grid, self.grid)).convert()
+                cell.fill(color)
+                sprites.append(cell)
+            self._cells = tuple(sprites)
+        return self._cells
+
+    def _build_grid(self) -> pygame.Surface:
+        # One outlined cell tiled into a row strip, then the strip tiled down the screen:
+        # two blits() calls instead of a draw.line per grid line.
+        grid = self.grid
+        tile = pygame.Surface((grid, grid)).convert()
+        tile.fill(settings.BACKGROUND)
+        tile.fill(settings.PANEL, (0, 0, grid, 1))
+        tile.fill(settings.PANEL, (0, 0, 1, grid))
+        row = pygame.Surface((settings.WIDTH, grid)).convert()
+        row.blits([(tile, (x, 0)) for x in range(0, settings.WIDTH, grid)], doreturn=False)
+        surface = pygame.Surface((settings.WIDTH, settings.HEIGHT)).convert()
+        surface.blits([(row, (0, y)) for y in range(0, settings.HEIGHT, grid)], doreturn=False)
+        return surface
 
     def _draw_game_over(self, surface: pygame.Surface) -> None:
-        overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((10, 10, 10, 180))
-        surface.blit(overlay, (0, 0))
-        title = self.primary_font.render("Crash! Press Enter to reset", True, settings.get_color("danger"))
+        if self._crash_overlay is None:
+            # Opaque fill with surface alpha blends like the old per-pixel overlay.
+            self._crash_overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT)).convert()
+            self._crash_overlay.fill((10, 10, 10))
+            self._crash_overlay.set_alpha(180)
+        surface.blit(self._crash_overlay, (0, 0))
+        title = self.render_hud("crash", self.primary_font, "Crash! Press Enter to reset", settings.DANGER)
         rect = title.get_rect(center=(settings.WIDTH // 2, settings.HEIGHT // 2))
         surface.blit(title, rect)
 
-    def _random_cell(self) -> pygame.Vector2:
-        while True:
-            cell = pygame.Vector2(
-                random.randint(0, self.cols - 1),
-                random.randint(0, self.rows - 1),
-            )
-            if cell not in self.body:
-                return cell
-
-    def _hits_wall(self, position: pygame.Vector2) -> bool:
-        return not (0 <= position.x < self.cols and 0 <= position.y < self.rows)
+    def _random_cell(self) -> Cell:
+        # A few blind probes almost always land on a free cell early on; once the
+        # board is crowded, pick uniformly from the free cells instead of retrying.
+        for _ in range(8):
+            index = random.randrange(len(self.occupancy))
+            if not self.occupancy[index]:
+                break
+        else:
+            index = random.choice([i for i, taken in enumerate(self.occupancy) if not taken])
+        return (index % self.cols, index // self.cols)
+
+    def _hits_wall(self, position: Cell) -> bool:
+        x, y = position
+        return not (0 <= x < self.cols and 0 <= y < self.rows)
@@ -1,16 +1,19 @@
 """Entry point for the Mini Arcade application."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Callable, Optional
 
 import pygame
 
 from . import settings
+from .games.base_game import BaseGame, locked_surface
 from .games.dodge import DodgeGame
 from .games.pong import PongGame
 from .games.snake import SnakeGame
 
+MENU_WAIT_MS = 250
+
 
 @dataclass
 class Button:
@@ -20,14 +23,24 @@ class Button:
     label: str
     action: Callable[[], None]
     hovered: bool = False
+    # Idle and hovered label surfaces, rendered on first draw.
+    _labels: Optional[tuple[pygame.Surface, pygame.Surface]] = field(default=None, repr=False)
 
     def draw(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
-        base_color = settings.get_color("panel")
-        accent = settings.get_color("accent")
-        color = accent if self.hovered else base_color
+        self.draw_frame(surface)
+        self.draw_label(surface, font)
+
+    def draw_frame(self, surface: pygame.Surface) -> None:
+        color = settings.ACCENT if self.hovered else settings.PANEL
         pygame.draw.rect(surface, color, self.rect, border_radius=10)
-        text_color = settings.get_color("background") if self.hovered else settings.get_color("text")
-        text = font.render(self.label, True, text_color)
+
+    def draw_label(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
+        if self._labels is None:
+            self._labels = (
+                font.render(self.label, True, settings.TEXT).convert_alpha(),
+                font.render(self.label, True, settings.BACKGROUND).convert_alpha(),
+            )
+        text = self._labels[1] if self.hovered else self._labels[0]
         surface.blit(text, text.get_rect(center=self.rect.center))
 
     def handle_click(self) -> None:
@@ -80,39 +93,94 @@ class ArcadeApp:
     def __init__(self) -> None:
         pygame.init()
         pygame.display.set_caption("Mini Arcade")
-        self.screen = pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
+        self.screen = self._open_display()
         self.clock = pygame.time.Clock()
+        # Opaque black sheet faded with surface alpha; built once instead of per frame.
+        self._fade_overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT)).convert()
+        self._fade_overlay.fill((0, 0, 0))
         self.title_font = pygame.font.Font(None, 80)
         self.menu_font = pygame.font.Font(None, 42)
         self.small_font = pygame.font.Font(None, 26)
         self.credit_tag = "Developer: tubakhxn"
+        self._static_text: dict[tuple[pygame.font.Font, str, tuple[int, int, int]], pygame.Surface] = {}
+        self._wrapped_text: dict[tuple[str, int], list[pygame.Surface]] = {}
 
-        self.games = {
-            "Snake": SnakeGame(),
-            "Pong": PongGame(),
-            "Dodge": DodgeGame(),
+        self.game_types: dict[str, type[BaseGame]] = {
+            "Snake": SnakeGame,
+            "Pong": PongGame,
+            "Dodge": DodgeGame,
         }
+        # Games are constructed the first time they are selected.
+        self.games: dict[str, BaseGame] = {}
         self.active_game: Optional[str] = None
         # Centralized transition controller keeps every scene change consistent.
         self.transition = FadeTransition(0.4)
         self.buttons = self._build_buttons()
         self.menu_hint = self.buttons[0].label
+        # The menu is static, so it only redraws after input changes what it shows.
+        self._menu_dirty = True
         self.running = True
 
+    @staticmethod
+    def _open_display() -> pygame.Surface:
+        """Open the window with vsync when the platform allows it."""
+        size = (settings.WIDTH, settings.HEIGHT)
+        try:
+            # SDL only honours vsync through a renderer, which SCALED provides.
+            screen = pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+        except pygame.error:
+            return pygame.display.set_mode(size)
+        # SCALED also grows the window to the largest integer multiple that fits the
+        # desktop; shrink it back so the arcade keeps its native window size.
+        try:
+            from pygame._sdl2.video import WINDOWPOS_CENTERED, Window
+
+            window = Window.from_display_module()
+            window.size = size
+            window.position = WINDOWPOS_CENTERED
+        except (ImportError, pygame.error):
+            pass
+        return screen
+
     def _build_buttons(self) -> list[Button]:
         buttons: list[Button] = []
-        total = len(self.games)
+        total = len(self.game_types)
         button_width = 280
         button_height = 72
         spacing = 18
         start_y = settings.HEIGHT // 2 - (total * (button_height + spacing)) // 2
-        for index, label in enumerate(self.games.keys()):
+        for index, label in enumerate(self.game_types.keys()):
             rect = pygame.Rect(0, 0, button_width, button_height)
             rect.centerx = settings.WIDTH // 4
             rect.y = start_y + index * (button_height + spacing)
             buttons.append(Button(rect, label, lambda name=label: self._queue_state_change(name)))
+        # Buttons share one column, so hit tests reduce to a range check and a division.
+        self._button_left = settings.WIDTH // 4 - button_width // 2
+        self._button_top = start_y
+        self._button_width = button_width
+        self._button_height = button_height
+        self._button_stride = button_height + spacing
         return buttons
 
+    def _button_at(self, pos: tuple[int, int]) -> Optional[Button]:
+        x, y = pos
+        if not (0 <= x - self._button_left < self._button_width and y >= self._button_top):
+            return None
+        index, offset = divmod(y - self._button_top, self._button_stride)
+        if index < len(self.buttons) and offset < self._button_height:
+            return self.buttons[index]
+        return None
+
+    def _update_hover(self, pos: tuple[int, int]) -> None:
+        target = self._button_at(pos)
+        for button in self.buttons:
+            is_hovered = button is target
+            if is_hovered != button.hovered:
+                button.hovered = is_hovered
+                self._menu_dirty = True
+        if target is not None:
+            self.menu_hint = target.label
+
     def _queue_state_change(self, target: Optional[str]) -> None:
         if target == self.active_game:
             return
@@ -120,89 +188,128 @@ class ArcadeApp:
 
     def run(self) -> None:
         while self.running:
-            dt = self.clock.tick(settings.FPS) / 1000.0
-            events = pygame.event.get()
+            if self.active_game is None and not self.transition.busy() and not self._menu_dirty:
+                # Idle menu: block in SDL until input arrives instead of spinning at FPS.
+                event = pygame.event.wait(MENU_WAIT_MS)
+                if event.type == pygame.NOEVENT:
+                    continue
+                events = [event, *pygame.event.get()]
+                # Restart the frame clock so the time spent asleep is not fed to dt.
+                self.clock.tick()
+                dt = 0.0
+            elif self.active_game:
+                # Games step on dt, so pay for precise pacing only while one is running.
+                dt = self.clock.tick_busy_loop(settings.FPS) / 1000.0
+                events = pygame.event.get()
+            else:
+                dt = self.clock.tick(settings.FPS) / 1000.0
+                events = pygame.event.get()
             for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
 
             if self.active_game:
                 self._run_active_game(events, dt)
+                drawn = True
             else:
-                self._run_menu(events)
-
-            self.transition.update(dt, self._apply_state_change)
-            self._draw_transition_overlay()
-            pygame.display.flip()
+                drawn = self._run_menu(events)
+
+            # Transitions are idle nearly all the time; skip the fade pipeline outright.
+            if self.transition.state != "idle":
+                self.transition.update(dt, self._apply_state_change)
+                self._draw_transition_overlay()
+            if drawn:
+                pygame.display.flip()
         pygame.quit()
 
-    def _run_menu(self, events: list[pygame.event.Event]) -> None:
-        mouse_pos = pygame.mouse.get_pos()
-        hovered = None
-        for button in self.buttons:
-            button.hovered = button.rect.collidepoint(mouse_pos)
-            if button.hovered:
-                hovered = button.label
-        if hovered:
-            self.menu_hint = hovered
+    def _run_menu(self, events: list[pygame.event.Event]) -> bool:
+        """Handle menu input and redraw if anything visible changed; return whether it drew."""
+        if self._menu_dirty:
+            # Entering the menu: the pointer may have moved while motion was blocked.
+            self._update_hover(pygame.mouse.get_pos())
         for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for button in self.buttons:
-                    if button.hovered:
-                        button.handle_click()
-                        break
+            if event.type == pygame.MOUSEMOTION:
+                self._update_hover(event.pos)
+            elif event.type == pygame.WINDOWEXPOSED:
+                self._menu_dirty = True
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                button = self._button_at(event.pos)
+                if button is not None:
+                    button.handle_click()
             elif event.type == pygame.KEYDOWN:
                 if event.key in (pygame.K_1, pygame.K_2, pygame.K_3):
                     index = event.key - pygame.K_1
                     if 0 <= index < len(self.buttons):
                         self.buttons[index].handle_click()
 
+        if not (self._menu_dirty or self.transition.busy()):
+            return False
         self._draw_menu()
+        self._menu_dirty = False
+        return True
+
+    def _render_static(self, font: pygame.font.Font, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """Render a label once and reuse the surface on every later frame."""
+        key = (font, text, color)
+        rendered = self._static_text.get(key)
+        if rendered is None:
+            rendered = self._static_text[key] = font.render(text, True, color).convert_alpha()
+        return rendered
 
     def _draw_menu(self) -> None:
-        self.screen.fill(settings.get_color("background"))
-        title = self.title_font.render("Mini Arcade", True, settings.get_color("text"))
+        self.screen.fill(settings.BACKGROUND)
+        title = self._render_static(self.title_font, "Mini Arcade", settings.TEXT)
         self.screen.blit(title, title.get_rect(center=(settings.WIDTH // 2, 120)))
 
-        for button in self.buttons:
-            button.draw(self.screen, self.menu_font)
-
+        # Shapes first under a single lock, then the text blits (which need it released).
         info_panel = pygame.Rect(settings.WIDTH // 2 + 60, 220, settings.WIDTH // 2 - 120, 260)
-        pygame.draw.rect(self.screen, settings.get_color("panel"), info_panel, border_radius=16)
-        pygame.draw.rect(self.screen, settings.get_color("accent_alt"), info_panel, width=2, border_radius=16)
+        with locked_surface(self.screen):
+            for button in self.buttons:
+                button.draw_frame(self.screen)
+            pygame.draw.rect(self.screen, settings.PANEL, info_panel, border_radius=16)
+            pygame.draw.rect(self.screen, settings.ACCENT_ALT, info_panel, width=2, border_radius=16)
+        for button in self.buttons:
+            button.draw_label(self.screen, self.menu_font)
 
-        hint_game = self.games.get(self.menu_hint)
+        hint_game = self.game_types.get(self.menu_hint)
         if hint_game:
-            title = self.menu_font.render(hint_game.name, True, settings.get_color("text"))
+            title = self._render_static(self.menu_font, hint_game.name, settings.TEXT)
             self.screen.blit(title, title.get_rect(midtop=(info_panel.centerx, info_panel.y + 16)))
             self._draw_wrapped_text(hint_game.instructions, info_panel.inflate(-40, -80), 28)
         else:
-            placeholder = self.small_font.render("Hover a game to view its controls", True, settings.get_color("muted"))
+            placeholder = self._render_static(self.small_font, "Hover a game to view its controls", settings.MUTED)
             self.screen.blit(placeholder, placeholder.get_rect(center=info_panel.center))
 
-        footer = self.small_font.render("Press 1/2/3 as shortcuts", True, settings.get_color("muted"))
+        footer = self._render_static(self.small_font, "Press 1/2/3 as shortcuts", settings.MUTED)
         self.screen.blit(footer, footer.get_rect(center=(settings.WIDTH // 2, settings.HEIGHT - 40)))
 
-        credit = self.small_font.render(self.credit_tag, True, settings.get_color("accent_alt"))
+        credit = self._render_static(self.small_font, self.credit_tag, settings.ACCENT_ALT)
         self.screen.blit(credit, credit.get_rect(bottomright=(settings.WIDTH - 24, settings.HEIGHT - 24)))
 
     def _draw_wrapped_text(self, text: str, rect: pygame.Rect, line_height: int) -> None:
-        words = text.split()
-        line = ""
+        key = (text, rect.width)
+        lines = self._wrapped_text.get(key)
+        if lines is None:
+            lines = self._wrapped_text[key] = self._wrap_text(text, rect.width)
         y = rect.y
-        for word in words:
+        for rendered in lines:
+            self.screen.blit(rendered, (rect.x, y))
+            y += line_height
+
+    def _wrap_text(self, text: str, width: int) -> list[pygame.Surface]:
+        """Break text into lines using font metrics, rendering each finished line once."""
+        lines: list[str] = []
+        line = ""
+        for word in text.split():
             test = f"{line} {word}".strip()
-            rendered = self.small_font.render(test, True, settings.get_color("text"))
-            if rendered.get_width() > rect.width and line:
-                rendered = self.small_font.render(line, True, settings.get_color("text"))
-                self.screen.blit(rendered, (rect.x, y))
-                y += line_height
+            if self.small_font.size(test)[0] > width and line:
+                lines.append(line)
                 line = word
             else:
                 line = test
         if line:
-            rendered = self.small_font.render(line, True, settings.get_color("text"))
-            self.screen.blit(rendered, (rect.x, y))
+            lines.append(line)
+        return [self.small_font.render(line, True, settings.TEXT).convert_alpha() for line in lines]
 
     def _run_active_game(self, events: list[pygame.event.Event], dt: float) -> None:
         game = self.games[self.active_game]
@@ -213,17 +320,23 @@ class ArcadeApp:
             game.update(dt)
         # Always render the latest state so the fade overlay works on the final frame too.
         game.draw(self.screen)
-        header = self.small_font.render(f"Playing: {game.name}", True, settings.get_color("text"))
+        header = self._render_static(self.small_font, f"Playing: {game.name}", settings.TEXT)
         self.screen.blit(header, (16, settings.HEIGHT - 36))
-        credit = self.small_font.render(self.credit_tag, True, settings.get_color("accent_alt"))
+        credit = self._render_static(self.small_font, self.credit_tag, settings.ACCENT_ALT)
         credit_pos = credit.get_rect(bottomright=(settings.WIDTH - 24, settings.HEIGHT - 36))
         self.screen.blit(credit, credit_pos)
 
     def _apply_state_change(self, target: Optional[str]) -> None:
         if target is None:
             self.active_game = None
+            self._menu_dirty = True
+            # The menu wakes on mouse motion for hover; games never read it.
+            pygame.event.set_allowed(pygame.MOUSEMOTION)
         else:
-            game = self.games[target]
+            pygame.event.set_blocked(pygame.MOUSEMOTION)
+            game = self.games.get(target)
+            if game is None:
+                game = self.games[target] = self.game_types[target]()
             game.reset()
             self.active_game = target
 
@@ -231,10 +344,8 @@ class ArcadeApp:
         alpha = self.transition.alpha()
         if alpha <= 0:
             return
-        overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-        overlay.set_alpha(alpha)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self._fade_overlay.set_alpha(alpha)
+        self.screen.blit(self._fade_overlay, (0, 0))
 
 
 def main() -> None:
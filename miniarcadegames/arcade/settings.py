@@ -4,15 +4,25 @@ WIDTH = 960
 HEIGHT = 600
 FPS = 60
 
+# Named constants let draw code read colors as plain module attributes.
+BACKGROUND = (10, 12, 24)
+PANEL = (21, 24, 45)
+ACCENT = (255, 176, 59)
+ACCENT_ALT = (59, 206, 255)
+TEXT = (235, 239, 247)
+MUTED = (114, 125, 140)
+DANGER = (255, 87, 102)
+SUCCESS = (93, 255, 206)
+
 COLORS = {
-    "background": (10, 12, 24),
-    "panel": (21, 24, 45),
-    "accent": (255, 176, 59),
-    "accent_alt": (59, 206, 255),
-    "text": (235, 239, 247),
-    "muted": (114, 125, 140),
-    "danger": (255, 87, 102),
-    "success": (93, 255, 206),
+    "background": BACKGROUND,
+    "panel": PANEL,
+    "accent": ACCENT,
+    "accent_alt": ACCENT_ALT,
+    "text": TEXT,
+    "muted": MUTED,
+    "danger": DANGER,
+    "success": SUCCESS,
 }
 
 def get_color(name: str) -> tuple[int, int, int]:
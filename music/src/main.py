@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 import numpy as np
 from PyQt5.QtCore import (
@@ -10,6 +10,7 @@ from PyQt5.QtCore import (
     QCoreApplication,
     QPropertyAnimation,
     Qt,
+    QTimer,
     QUrl,
 )
 from PyQt5.QtGui import QFont
@@ -24,7 +25,6 @@ from PyQt5.QtWidgets import (
     QApplication,
     QFileDialog,
     QFrame,
-    QGraphicsDropShadowEffect,
     QGraphicsOpacityEffect,
     QHBoxLayout,
     QLabel,
@@ -42,6 +42,7 @@ from PyQt5.QtWidgets import (
 
 from .metadata import AudioTrack
 from .playlist import PlaylistManager
+from .shadow import DropShadow
 from .visualizer import AudioVisualizer
 
 APP_NAME = "Aurora Music Player"
@@ -49,6 +50,9 @@ BASE_DIR = Path(__file__).resolve().parent
 ASSET_DIR = BASE_DIR.parent / "assets"
 STYLE_SHEET = ASSET_DIR / "style.qss"
 SUPPORTED_EXTENSIONS = ["*.mp3", "*.MP3", "*.wav", "*.WAV"]
+WINDOW_CACHE_SIZE = 8
+PCM_RING_SIZE = 4096
+SPECTRUM_INTERVAL_MS = 33
 
 
 class MusicPlayer(QMainWindow):
@@ -61,6 +65,15 @@ class MusicPlayer(QMainWindow):
 
         self.playlist = PlaylistManager()
         self._slider_pressed = False
+        self._last_second = -1
+        # Path of the media currently set on the player, so replays can skip setMedia.
+        self._loaded_path: Optional[Path] = None
+        # Hann windows keyed by buffer length; probes repeat the same few sizes.
+        self._window_cache: dict[int, np.ndarray] = {}
+        # Probed PCM lands in a mono ring; a fixed-rate timer turns it into spectra.
+        self._pcm_ring = np.zeros(PCM_RING_SIZE, dtype=np.float32)
+        self._ring_index = 0
+        self._pcm_pending = False
 
         self._build_player()
         self._wire_player()
@@ -72,10 +85,13 @@ class MusicPlayer(QMainWindow):
     def _build_player(self) -> None:
         self.player = QMediaPlayer(self)
         self.player.setVolume(60)
-        self.player.setNotifyInterval(100)
+        # The clock label only shows whole seconds, so four position updates a second suffice.
+        self.player.setNotifyInterval(250)
 
         self.audio_probe = QAudioProbe(self)
         self._probe_available = self.audio_probe.setSource(self.player)
+        self._spectrum_timer = QTimer(self)
+        self._spectrum_timer.setInterval(SPECTRUM_INTERVAL_MS)
 
         central = QWidget(self)
         main_layout = QHBoxLayout(central)
@@ -107,11 +123,7 @@ class MusicPlayer(QMainWindow):
         right_panel = QVBoxLayout()
         right_panel.setSpacing(18)
 
-        self.metadata_shell = QFrame()
-        shell_layout = QVBoxLayout(self.metadata_shell)
-        shell_layout.setContentsMargins(0, 0, 0, 0)
-
-        self.metadata_card = QFrame(self.metadata_shell)
+        self.metadata_card = QFrame()
         self.metadata_card.setObjectName("metadataCard")
         metadata_layout = QVBoxLayout(self.metadata_card)
         metadata_layout.setContentsMargins(24, 24, 24, 24)
@@ -139,14 +151,9 @@ class MusicPlayer(QMainWindow):
         self.metadata_anim.setEndValue(1.0)
         self.metadata_anim.setEasingCurve(QEasingCurve.InOutQuad)
 
-        drop_shadow = QGraphicsDropShadowEffect(self.metadata_shell)
-        drop_shadow.setBlurRadius(32)
-        drop_shadow.setOffset(0, 12)
-        drop_shadow.setColor(Qt.black)
-        self.metadata_shell.setGraphicsEffect(drop_shadow)
-        shell_layout.addWidget(self.metadata_card)
-
-        right_panel.addWidget(self.metadata_shell)
+        # Cached nine-slice shadows replace QGraphicsDropShadowEffect, which re-blurred on every repaint.
+        right_panel.addWidget(self.metadata_card)
+        self.metadata_shadow = DropShadow(self.metadata_card, blur=32, offset=12, corner=24)
 
         # Progress controls
         progress_layout = QVBoxLayout()
@@ -192,12 +199,8 @@ class MusicPlayer(QMainWindow):
 
         # Visualizer section
         self.visualizer = AudioVisualizer(bars=48)
-        viz_shadow = QGraphicsDropShadowEffect(self.visualizer)
-        viz_shadow.setBlurRadius(24)
-        viz_shadow.setOffset(0, 8)
-        viz_shadow.setColor(Qt.black)
-        self.visualizer.setGraphicsEffect(viz_shadow)
         right_panel.addWidget(self.visualizer, stretch=1)
+        self.visualizer_shadow = DropShadow(self.visualizer, blur=24, offset=8)
 
         main_layout.addLayout(left_panel, stretch=0)
         main_layout.addLayout(right_panel, stretch=1)
@@ -232,6 +235,8 @@ class MusicPlayer(QMainWindow):
 
         if self._probe_available:
             self.audio_probe.audioBufferProbed.connect(self._handle_buffer)
+            self._spectrum_timer.timeout.connect(self._flush_spectrum)
+            self._spectrum_timer.start()
         else:
             self.statusBar().showMessage(
                 "Audio visualizer unavailable on this device.",
@@ -248,7 +253,8 @@ class MusicPlayer(QMainWindow):
         if not added_tracks:
             QMessageBox.information(self, APP_NAME, "No readable audio files were added.")
             return
-        self._refresh_playlist_view()
+        self._append_playlist_items(added_tracks)
+        self._select_current_row()
         self.statusBar().showMessage(f"Added {len(added_tracks)} track(s).", 3000)
         if self.playlist.current_track() and self.player.mediaStatus() == QMediaPlayer.NoMedia:
             self._load_track(self.playlist.current_track(), autoplay=False)
@@ -260,11 +266,17 @@ class MusicPlayer(QMainWindow):
             return
         removed = self.playlist.remove_index(row)
         if removed:
-            self._refresh_playlist_view()
+            # Drop just the one row; signals stay off while rows shift, then sync the selection once.
+            self.playlist_list.blockSignals(True)
+            self.playlist_list.takeItem(row)
+            self._select_current_row()
+            self.playlist_list.blockSignals(False)
+            self._handle_selection_change(self.playlist_list.currentRow())
             self.statusBar().showMessage(f"Removed {removed.title}.", 3000)
             if not self.playlist.has_tracks():
                 self.player.stop()
                 self.player.setMedia(QMediaContent())
+                self._loaded_path = None
                 self._update_metadata(None)
 
     def _play_from_double_click(self, item: QListWidgetItem) -> None:
@@ -317,7 +329,10 @@ class MusicPlayer(QMainWindow):
     def _sync_position(self, position: int) -> None:
         if not self._slider_pressed:
             self.progress_slider.setValue(position)
-        self._update_time_label(position=position)
+        second = position // 1000
+        if second != self._last_second:
+            self._last_second = second
+            self._update_time_label(position=position)
 
     def _sync_duration(self, duration: int) -> None:
         self.progress_slider.setRange(0, duration)
@@ -342,26 +357,46 @@ class MusicPlayer(QMainWindow):
         QMessageBox.critical(self, APP_NAME, f"Playback error: {message}")
 
     def _handle_buffer(self, buffer: QAudioBuffer) -> None:
-        magnitudes = self._buffer_to_magnitudes(buffer)
-        if magnitudes.size:
-            self.visualizer.push_spectrum(magnitudes)
+        samples = self._buffer_to_samples(buffer)
+        if samples.size:
+            self._write_ring(samples)
+
+    def _flush_spectrum(self) -> None:
+        if not self._pcm_pending:
+            return
+        self._pcm_pending = False
+        # Unroll the ring oldest-first; the concatenation is a private copy for the FFT.
+        index = self._ring_index
+        samples = np.concatenate((self._pcm_ring[index:], self._pcm_ring[:index]))
+        self.visualizer.push_spectrum(self._samples_to_magnitudes(samples))
 
     # Helpers -------------------------------------------------------------
-    def _refresh_playlist_view(self) -> None:
-        self.playlist_list.clear()
-        for track in self.playlist.tracks():
-            item = QListWidgetItem(track.display_text)
-            self.playlist_list.addItem(item)
+    def _append_playlist_items(self, tracks: Sequence[AudioTrack]) -> None:
+        # Rows mirror the playlist 1:1, so new tracks are appended without rebuilding the list.
+        self.playlist_list.setUpdatesEnabled(False)
+        self.playlist_list.blockSignals(True)
+        try:
+            for track in tracks:
+                self.playlist_list.addItem(QListWidgetItem(track.display_text))
+        finally:
+            self.playlist_list.blockSignals(False)
+            self.playlist_list.setUpdatesEnabled(True)
+
+    def _select_current_row(self) -> None:
         current = self.playlist.current_track()
         if current:
-            current_index = self.playlist.index_of(current)
-            self.playlist_list.setCurrentRow(current_index)
+            self.playlist_list.setCurrentRow(self.playlist.index_of(current))
 
     def _load_track(self, track: Optional[AudioTrack], autoplay: bool) -> None:
         if not track:
             return
-        media = QMediaContent(QUrl.fromLocalFile(str(track.path)))
-        self.player.setMedia(media)
+        if track.path == self._loaded_path and self.player.mediaStatus() != QMediaPlayer.NoMedia:
+            # Same file is already open in the backend; rewinding avoids a full reload.
+            self.player.setPosition(0)
+        else:
+            media = QMediaContent(QUrl.fromLocalFile(str(track.path)))
+            self.player.setMedia(media)
+            self._loaded_path = track.path
         self._update_metadata(track)
         index = self.playlist.index_of(track)
         if index >= 0:
@@ -396,8 +431,26 @@ class MusicPlayer(QMainWindow):
         minutes, seconds = divmod(seconds, 60)
         return f"{minutes:02d}:{seconds:02d}"
 
-    def _buffer_to_magnitudes(self, buffer: QAudioBuffer) -> np.ndarray:
-        # Convert the raw PCM data captured via QAudioProbe into an FFT magnitude array.
+    def _write_ring(self, samples: np.ndarray) -> None:
+        ring = self._pcm_ring
+        size = ring.size
+        if samples.size >= size:
+            ring[:] = samples[-size:]
+            self._ring_index = 0
+        else:
+            start = self._ring_index
+            end = start + samples.size
+            if end <= size:
+                ring[start:end] = samples
+            else:
+                split = size - start
+                ring[start:] = samples[:split]
+                ring[: end - size] = samples[split:]
+            self._ring_index = end % size
+        self._pcm_pending = True
+
+    def _buffer_to_samples(self, buffer: QAudioBuffer) -> np.ndarray:
+        # Convert the raw PCM data captured via QAudioProbe into mono float32 samples.
         fmt: QAudioFormat = buffer.format()
         sample_type = fmt.sampleType()
         sample_size = fmt.sampleSize()
@@ -413,33 +466,52 @@ class MusicPlayer(QMainWindow):
             return np.array([])
 
         raw = buffer.data()
-        if isinstance(raw, (bytes, bytearray, memoryview)):
-            array = np.frombuffer(raw, dtype=dtype)
-        else:
-            array = np.frombuffer(bytes(raw), dtype=dtype)
+        if not isinstance(raw, (bytes, bytearray, memoryview)):
+            if hasattr(raw, "setsize"):
+                # A sized sip.voidptr exposes the buffer protocol, so numpy can view the
+                # PCM in place; the float32 cast below makes the private copy.
+                raw.setsize(buffer.byteCount())
+            else:
+                raw = bytes(raw)
+        array = np.frombuffer(raw, dtype=dtype)
 
         if array.size == 0:
             return np.array([])
 
         if sample_type == QAudioFormat.UnSignedInt:
-            array = array.astype(np.int32) - (np.iinfo(dtype).max // 2)
+            array = array.astype(np.float32) - np.float32(np.iinfo(dtype).max // 2)
         else:
             array = array.astype(np.float32)
 
         frames = (array.size // channel_count) * channel_count
-        array = array[:frames]
-        if channel_count > 1:
-            array = array.reshape(-1, channel_count).mean(axis=1)
+        if channel_count == 2:
+            # Interleaved stereo: sum the two strided channel views into one mono array.
+            array = array[0:frames:2] + array[1:frames:2]
+            array *= 0.5
+        elif channel_count > 2:
+            array = array[:frames].reshape(-1, channel_count).sum(axis=1, dtype=np.float32)
+            array *= 1.0 / channel_count
+        else:
+            array = array[:frames]
 
-        if not array.size:
-            return np.array([])
+        return array
 
-        window = np.hanning(array.size)
-        spectrum = np.fft.rfft(array * window)
+    def _samples_to_magnitudes(self, array: np.ndarray) -> np.ndarray:
+        # Window the samples in place and return the log-scaled FFT magnitudes.
+        array *= self._hann_window(array.size)
+        spectrum = np.fft.rfft(array)
         magnitudes = np.abs(spectrum)
-        magnitudes = np.log1p(magnitudes)
+        np.log1p(magnitudes, out=magnitudes)
         return magnitudes
 
+    def _hann_window(self, size: int) -> np.ndarray:
+        window = self._window_cache.get(size)
+        if window is None:
+            if len(self._window_cache) >= WINDOW_CACHE_SIZE:
+                self._window_cache.pop(next(iter(self._window_cache)))
+            window = self._window_cache[size] = np.hanning(size).astype(np.float32)
+        return window
+
     def _load_stylesheet(self) -> None:
         if STYLE_SHEET.exists():
             with STYLE_SHEET.open("r", encoding="utf-8") as handle:
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 from mutagen import File as MutagenFile
+from mutagen.id3 import TAL, TALB, TIT2, TP1, TPE1, TT2
+from mutagen.mp3 import MP3
+
+# Only the frames the player shows get decoded; cover art and the rest stay raw bytes.
+# ID3v2.2 tags use three-letter ids and are kept untranslated, so both spellings are listed.
+_MP3_FRAMES = {"TIT2": TIT2, "TPE1": TPE1, "TALB": TALB, "TT2": TT2, "TP1": TP1, "TAL": TAL}
 
 
 @dataclass
@@ -46,15 +53,24 @@ def load_track_metadata(path: str | Path) -> Optional[AudioTrack]:
     """Load metadata for the provided file path using mutagen."""
 
     resolved = Path(path).expanduser().resolve()
-    if not resolved.exists():
+    try:
+        stat = resolved.stat()
+    except OSError:
         return None
+    # Keyed on mtime and size so an edited file is re-read but a re-added one is free.
+    return _read_track_metadata(resolved, stat.st_mtime_ns, stat.st_size)
 
+
+@lru_cache(maxsize=4096)
+def _read_track_metadata(resolved: Path, mtime_ns: int, size: int) -> AudioTrack:
     title = resolved.stem
     artist = ""
     album = ""
     duration = 0.0
 
     try:
+        if resolved.suffix.lower() == ".mp3":
+            return _load_mp3_metadata(resolved)
         meta = MutagenFile(resolved, easy=True)
         if meta is not None:
             duration = getattr(getattr(meta, "info", None), "length", 0.0) or 0.0
@@ -73,3 +89,16 @@ def load_track_metadata(path: str | Path) -> Optional[AudioTrack]:
         duration=duration,
         path=resolved,
     )
+
+
+def _load_mp3_metadata(resolved: Path) -> AudioTrack:
+    # ID3v1 still fills in whatever an incomplete ID3v2 tag leaves out.
+    meta = MP3(resolved, known_frames=_MP3_FRAMES, translate=False)
+    tags = meta.tags or {}
+    return AudioTrack(
+        title=_safe_tag(tags.get("TT2") or tags.get("TIT2")) or resolved.stem,
+        artist=_safe_tag(tags.get("TP1") or tags.get("TPE1")),
+        album=_safe_tag(tags.get("TAL") or tags.get("TALB")),
+        duration=getattr(meta.info, "length", 0.0) or 0.0,
+        path=resolved,
+    )
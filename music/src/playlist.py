@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Sequence
 
 from .metadata import AudioTrack, load_track_metadata
 
@@ -13,8 +15,9 @@ class PlaylistManager:
         self._current_index: int = -1
 
     # Public API -----------------------------------------------------------
-    def tracks(self) -> List[AudioTrack]:
-        return list(self._tracks)
+    def tracks(self) -> Sequence[AudioTrack]:
+        # Read-only snapshot; a tuple is cheaper to build than a list copy.
+        return tuple(self._tracks)
 
     def current_track(self) -> Optional[AudioTrack]:
         if 0 <= self._current_index < len(self._tracks):
@@ -22,12 +25,16 @@ class PlaylistManager:
         return None
 
     def add_paths(self, paths: Iterable[str]) -> List[AudioTrack]:
-        added: List[AudioTrack] = []
-        for path in paths:
-            track = load_track_metadata(path)
-            if track:
-                self._tracks.append(track)
-                added.append(track)
+        paths = list(paths)
+        if len(paths) > 1:
+            # Tag reads are mostly file I/O, so threads overlap them; map keeps input order.
+            workers = min(16, len(paths), (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(load_track_metadata, paths))
+        else:
+            loaded = [load_track_metadata(path) for path in paths]
+        added: List[AudioTrack] = [track for track in loaded if track]
+        self._tracks.extend(added)
         if self._tracks and self._current_index == -1:
             self._current_index = 0
         return added
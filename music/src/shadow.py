@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from PyQt5.QtCore import QEvent, QObject, QRect, Qt
+from PyQt5.QtGui import QColor, QPainter, QPaintEvent, QPixmap
+from PyQt5.QtWidgets import QWidget
+
+
+@lru_cache(maxsize=None)
+def shadow_pixmap(blur: int, corner: int, strength: int = 200) -> QPixmap:
+    """Soft rounded-rect shadow, rasterized once and stretched as a nine-slice."""
+    edge = blur + corner
+    size = 2 * edge + 1
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    # Stacked translucent rects that shrink toward the middle build up a blur-like falloff.
+    painter.setBrush(QColor(0, 0, 0, max(1, strength // max(blur, 1))))
+    for inset in range(max(blur, 1)):
+        radius = edge - inset
+        painter.drawRoundedRect(QRect(inset, inset, size - 2 * inset, size - 2 * inset), radius, radius)
+    painter.end()
+    return pixmap
+
+
+class DropShadow(QWidget):
+    """Cached shadow painted behind a target widget without taking layout space.
+
+    Like QGraphicsDropShadowEffect, the shadow spills past the target's rect into its
+    parent, so the target keeps the geometry its layout gives it.
+    """
+
+    def __init__(self, target: QWidget, blur: int, offset: int, corner: int = 0) -> None:
+        super().__init__(target.parentWidget())
+        self._target = target
+        self._blur = blur
+        self._offset = offset
+        self._corner = corner
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        # The target is usually parented later, when its layout is installed on a widget.
+        target.installEventFilter(self)
+        self._sync()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is self._target:
+            kind = event.type()
+            if kind == QEvent.ParentChange:
+                self.setParent(self._target.parentWidget())
+                self._sync()
+            elif kind in (QEvent.Move, QEvent.Resize, QEvent.Show, QEvent.Hide):
+                self._sync()
+        return False
+
+    def _sync(self) -> None:
+        target = self._target
+        if self.parentWidget() is None or not target.isVisible():
+            self.hide()
+            return
+        blur = self._blur
+        self.setGeometry(target.geometry().translated(0, self._offset).adjusted(-blur, -blur, blur, blur))
+        self.stackUnder(target)
+        self.show()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        pixmap = shadow_pixmap(self._blur, self._corner)
+        edge = self._blur + self._corner
+        size = pixmap.width()
+        target = self.rect()
+        source_x = (0, edge, size - edge, size)
+        target_x = (target.left(), target.left() + edge, target.right() + 1 - edge, target.right() + 1)
+        target_y = (target.top(), target.top() + edge, target.bottom() + 1 - edge, target.bottom() + 1)
+        painter = QPainter(self)
+        for col in range(3):
+            width = target_x[col + 1] - target_x[col]
+            if width <= 0:
+                continue
+            for row in range(3):
+                height = target_y[row + 1] - target_y[row]
+                if height <= 0:
+                    continue
+                painter.drawPixmap(
+                    QRect(target_x[col], target_y[row], width, height),
+                    pixmap,
+                    QRect(source_x[col], source_x[row], source_x[col + 1] - source_x[col], source_x[row + 1] - source_x[row]),
+                )
+        painter.end()
@@ -1,66 +1,87 @@
 from __future__ import annotations
 
 import numpy as np
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from PyQt5.QtCore import QTimer
-from PyQt5.QtWidgets import QVBoxLayout, QWidget
+from PyQt5.QtCore import QRectF, QSize, Qt, QTimer
+from PyQt5.QtGui import QColor, QPainter, QPaintEvent
+from PyQt5.QtWidgets import QWidget
 
 
 class AudioVisualizer(QWidget):
-    """Matplotlib-based bar visualizer embedded into a QWidget."""
+    """QPainter-based bar visualizer drawn straight onto the widget."""
 
     def __init__(self, bars: int = 32, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._bars = bars
-        self._figure = Figure(figsize=(5, 2.5), facecolor="none")
-        self._canvas = FigureCanvas(self._figure)
-        self._ax = self._figure.add_subplot(111)
-        self._ax.set_facecolor("#030712")
-        self._ax.set_xticks([])
-        self._ax.set_yticks([])
-        self._ax.set_ylim(0, 1)
-        self._ax.set_xlim(-0.5, self._bars - 0.5)
-        self._ax.spines["bottom"].set_color("#1f2937")
-        self._ax.spines["top"].set_color("#1f2937")
-        self._ax.spines["left"].set_color("#1f2937")
-        self._ax.spines["right"].set_color("#1f2937")
-        initial_data = np.zeros(self._bars)
-        self._rects = self._ax.bar(range(self._bars), initial_data, color="#38bdf8", width=0.8)
+        self._background = QColor("#030712")
+        self._border = QColor("#1f2937")
+        self._bar_color = QColor("#38bdf8")
+        # Value mapped to the full widget height, like the old axis y-limit.
+        self._ceiling = 1.0
 
-        layout = QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self._canvas)
-        self.setLayout(layout)
-
-        self._decay = np.zeros(self._bars)
+        # Bar heights live in one preallocated buffer; the flag skips idle decay ticks.
+        self._decay = np.zeros(self._bars, dtype=np.float32)
+        self._decay_active = False
+        # Interpolation grids keyed by spectrum length; the FFT size rarely changes.
+        self._interp_cache: dict[int, tuple[np.ndarray, np.ndarray]] = {}
         self._timer = QTimer(self)
         self._timer.setInterval(60)
         self._timer.timeout.connect(self._decay_step)
         self._timer.start()
 
+    def sizeHint(self) -> QSize:
+        return QSize(500, 250)
+
     # Public API -----------------------------------------------------------
     def push_spectrum(self, magnitudes: np.ndarray) -> None:
         if magnitudes.size == 0:
             return
-        grouped = np.interp(
-            np.linspace(0, magnitudes.size - 1, self._bars),
-            np.arange(magnitudes.size),
-            magnitudes,
-        )
+        grid = self._interp_cache.get(magnitudes.size)
+        if grid is None:
+            grid = (
+                np.linspace(0, magnitudes.size - 1, self._bars),
+                np.arange(magnitudes.size),
+            )
+            self._interp_cache[magnitudes.size] = grid
+        x, xp = grid
+        grouped = np.interp(x, xp, magnitudes)
         normalized = grouped / (grouped.max() or 1)
         normalized = np.clip(normalized, 0, 1)
-        self._decay = normalized
-        for rect, height in zip(self._rects, normalized):
-            rect.set_height(height)
-        self._ax.set_ylim(0, max(1.0, normalized.max() * 1.2))
-        self._canvas.draw_idle()
+        np.copyto(self._decay, normalized)
+        self._decay_active = True
+        self._ceiling = max(1.0, normalized.max() * 1.2)
+        self.update()
 
     # Internal -------------------------------------------------------------
     def _decay_step(self) -> None:
-        if not np.any(self._decay):
+        if not self._decay_active:
             return
         self._decay *= 0.92
-        for rect, height in zip(self._rects, self._decay):
-            rect.set_height(height)
-        self._canvas.draw_idle()
+        if self._decay.max() < 1e-4:
+            self._decay.fill(0.0)
+            self._decay_active = False
+        self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        width = self.width()
+        height = self.height()
+        slot = width / self._bars
+        # Bar geometry is computed for all bars at once; only the QRectF wrapping is per bar.
+        tops = height - self._decay * (height / self._ceiling)
+        lefts = np.arange(self._bars) * slot + slot * 0.1
+        bar_width = slot * 0.8
+        rects = [
+            QRectF(left, top, bar_width, height - top)
+            for left, top in zip(lefts.tolist(), tops.tolist())
+            if top < height
+        ]
+
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self._background)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._bar_color)
+        if rects:
+            painter.drawRects(rects)
+        painter.setPen(self._border)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(self.rect().adjusted(0, 0, -1, -1))
+        painter.end()
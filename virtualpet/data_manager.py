@@ -1,4 +1,5 @@
 import json
+import os
 import time
 from pathlib import Path
 from typing import Dict, Tuple
@@ -7,10 +8,11 @@ from settings import BASE_DIR, STAT_NAMES, STORAGE_FILE, STAT_MAX
 
 DEFAULT_STATS = {name: STAT_MAX * 0.8 for name in STAT_NAMES}
 
+STORAGE_FILE.parent.mkdir(parents=True, exist_ok=True)
+
 
 def ensure_storage_file() -> None:
     """Make sure we have a valid storage file for the pet state."""
-    STORAGE_FILE.parent.mkdir(parents=True, exist_ok=True)
     if not STORAGE_FILE.exists():
         save_state(DEFAULT_STATS, sleeping=False)
 
@@ -34,6 +36,7 @@ def save_state(stats: Dict[str, float], sleeping: bool) -> None:
         "last_timestamp": time.time(),
         "sleeping": sleeping,
     }
-    STORAGE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with STORAGE_FILE.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
+    # Write a sibling temp file and swap it in, so a crash mid-save never leaves a torn file.
+    temp_file = STORAGE_FILE.with_suffix(".tmp")
+    temp_file.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.replace(temp_file, STORAGE_FILE)
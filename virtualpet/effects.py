@@ -2,46 +2,46 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 import pygame
 
 from settings import COLOR_PALETTE
 
+ALPHA_STEP = 16
+
 
 @dataclass
 class Particle:
-    position: pygame.Vector2
-    velocity: pygame.Vector2
+    # Plain float components: the per-frame update then allocates no Vector2 temporaries.
+    x: float
+    y: float
+    vx: float
+    vy: float
     life: float
     color: Tuple[int, int, int]
     size: float
 
     def update(self, dt: float) -> None:
         self.life -= dt
-        self.position += self.velocity * dt
-        self.velocity.y -= 10 * dt
-
-    def draw(self, surface: pygame.Surface) -> None:
-        alpha = max(0, min(255, int(255 * (self.life / 1.2))))
-        if alpha <= 0:
-            return
-        color = (*self.color, alpha)
-        temp_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(temp_surface, color, (self.size, self.size), self.size)
-        surface.blit(temp_surface, (self.position.x - self.size, self.position.y - self.size))
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.vy -= 10 * dt
 
 
 class ParticleSystem:
     def __init__(self) -> None:
         self.particles: List[Particle] = []
+        # Circle sprites keyed by (radius, color, alpha bucket), rasterized on first use.
+        self._sprites: Dict[Tuple[int, Tuple[int, int, int], int], pygame.Surface] = {}
 
     def emit_heart(self, origin: Tuple[int, int]) -> None:
         for _ in range(6):
-            vel = pygame.Vector2(random.uniform(-10, 10), random.uniform(-5, 5))
             part = Particle(
-                position=pygame.Vector2(origin),
-                velocity=vel,
+                x=origin[0],
+                y=origin[1],
+                vx=random.uniform(-10, 10),
+                vy=random.uniform(-5, 5),
                 life=random.uniform(0.6, 1.2),
                 color=COLOR_PALETTE["accent"],
                 size=random.uniform(6, 10),
@@ -50,10 +50,11 @@ class ParticleSystem:
 
     def emit_star(self, origin: Tuple[int, int]) -> None:
         for _ in range(4):
-            vel = pygame.Vector2(random.uniform(-15, 15), random.uniform(-5, 5))
             part = Particle(
-                position=pygame.Vector2(origin),
-                velocity=vel,
+                x=origin[0],
+                y=origin[1],
+                vx=random.uniform(-15, 15),
+                vy=random.uniform(-5, 5),
                 life=random.uniform(0.4, 0.9),
                 color=COLOR_PALETTE["accent_dark"],
                 size=random.uniform(4, 7),
@@ -61,11 +62,28 @@ class ParticleSystem:
             self.particles.append(part)
 
     def update(self, dt: float) -> None:
-        for particle in list(self.particles):
+        for particle in self.particles:
             particle.update(dt)
-            if particle.life <= 0:
-                self.particles.remove(particle)
+        # One filtering pass instead of an O(n) list.remove per expired particle.
+        self.particles[:] = [particle for particle in self.particles if particle.life > 0]
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        batch = []
         for particle in self.particles:
-            particle.draw(surface)
+            alpha = max(0, min(255, int(255 * (particle.life / 1.2))))
+            if alpha <= 0:
+                continue
+            radius = int(particle.size)
+            sprite = self._sprite(radius, particle.color, alpha // ALPHA_STEP)
+            batch.append((sprite, (particle.x - radius, particle.y - radius)))
+        return surface.blits(batch)
+
+    def _sprite(self, radius: int, color: Tuple[int, int, int], bucket: int) -> pygame.Surface:
+        key = (radius, color, bucket)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            alpha = min(255, bucket * ALPHA_STEP + ALPHA_STEP // 2)
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, alpha), (radius, radius), radius)
+            sprite = self._sprites[key] = sprite.convert_alpha()
+        return sprite
@@ -9,23 +9,30 @@ import pygame
 
 from data_manager import load_state, save_state
 from pet import Pet
-from settings import FPS, SCREEN_HEIGHT, SCREEN_WIDTH
+from settings import FPS, SCREEN_HEIGHT, SCREEN_WIDTH, SIM_STEP
 from ui import GameUI
 from utils import create_tone_sound
 
+# Every tone the pet's reactions ask for; synthesized up front so the first play doesn't hitch.
+KNOWN_TONES = (220, 420, 520, 600, 650, 700)
+
 
 class SoundManager:
     def __init__(self) -> None:
         self.cache: Dict[int, pygame.mixer.Sound] = {}
         self.enabled = True
+        if pygame.mixer.get_init():
+            for frequency in KNOWN_TONES:
+                self.cache[frequency] = create_tone_sound(pygame, frequency, 0.2)
 
     def play(self, frequency: float) -> None:
         if not self.enabled:
             return
         freq_key = int(frequency)
-        if freq_key not in self.cache:
-            self.cache[freq_key] = create_tone_sound(pygame, freq_key, 0.2)
-        self.cache[freq_key].play()
+        sound = self.cache.get(freq_key)
+        if sound is None:
+            sound = self.cache[freq_key] = create_tone_sound(pygame, freq_key, 0.2)
+        sound.play()
 
 
 class VirtualPetGame:
@@ -33,7 +40,8 @@ class VirtualPetGame:
         pygame.mixer.pre_init(44100, -16, 1, 256)
         pygame.init()
         pygame.display.set_caption("Mochi the Virtual Pal")
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # SCALED lets SDL upscale on the GPU; every cached surface is converted to match this display.
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED | pygame.DOUBLEBUF)
         self.clock = pygame.time.Clock()
         stats, last_timestamp, sleeping = load_state()
         self.pet = Pet(stats, sleeping)
@@ -44,24 +52,41 @@ class VirtualPetGame:
         self.ui = GameUI(self.font_large, self.font_small)
         self.sound_manager = SoundManager()
         self.running = True
+        self._sim_accum = 0.0
 
     def run(self) -> None:
+        # Loop-invariant lookups bound once; the body runs every frame.
+        tick = self.clock.tick
+        get_events = pygame.event.get
+        update_display = pygame.display.update
+        pet = self.pet
+        ui = self.ui
+        screen = self.screen
+        sound_manager = self.sound_manager
+        sound_toggle = ui.sound_toggle
+        handle_action = self.handle_action
         while self.running:
-            dt = self.clock.tick(FPS) / 1000
-            for event in pygame.event.get():
+            dt = tick(FPS) / 1000
+            for event in get_events():
                 if event.type == pygame.QUIT:
                     self.running = False
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     self.running = False
-                submitted, text = self.ui.handle_event(event, self.handle_action)
+                submitted, text = ui.handle_event(event, handle_action)
                 if submitted and text:
-                    reaction = self.pet.respond_to_text(text)
+                    reaction = pet.respond_to_text(text)
                     self.process_reaction(reaction)
-            self.pet.update(dt)
-            self.ui.update(dt)
-            self.sound_manager.enabled = self.ui.sound_toggle.enabled
-            self.ui.draw(self.screen, self.pet, dt)
-            pygame.display.flip()
+                # The toggle only flips on input, so the sound flag is synced here.
+                if sound_manager.enabled != sound_toggle.enabled:
+                    sound_manager.enabled = sound_toggle.enabled
+            # Fixed-step stat simulation; rendering and animation still follow the frame dt.
+            self._sim_accum += dt
+            while self._sim_accum >= SIM_STEP:
+                pet.update(SIM_STEP)
+                self._sim_accum -= SIM_STEP
+            pet.update_animation(dt)
+            ui.update(dt)
+            update_display(ui.draw(screen, pet, dt))
         self.shutdown()
 
     def handle_action(self, action: str) -> None:
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import random
 import time
+from operator import itemgetter
 from typing import Dict
 
 from settings import (
     ACTION_EFFECTS,
     DECAY_PER_SECOND,
+    FPS,
     IDLE_DIALOGUE_INTERVAL,
     IDLE_MESSAGES,
     MOOD_THRESHOLDS,
@@ -16,10 +18,33 @@ from settings import (
     STAT_MIN,
     STAT_NAMES,
     TYPE_RESPONSE_FALLBACKS,
-    RESPONSE_LIBRARY,
+    RESPONSE_PATTERN,
+    RESPONSE_REPLIES,
 )
 from utils import clamp, pick_response, random_in_range
 
+# Mood thresholds flattened once into (mood, stat, limit) rows, in priority order.
+_SICK_HEALTH = MOOD_THRESHOLDS["sick"]["health"]
+_MOOD_LIMITS = tuple(
+    (mood, stat, limit)
+    for mood in ("hungry", "sleepy", "dirty", "bored")
+    for stat, limit in MOOD_THRESHOLDS[mood].items()
+)
+_HAPPY_LIMITS = tuple(MOOD_THRESHOLDS["happy"].items())
+
+# Health trails the average of the four care stats.
+_CARE_STATS = ("hunger", "happiness", "energy", "cleanliness")
+_CARE_DECAY = tuple((stat, DECAY_PER_SECOND[stat]) for stat in _CARE_STATS)
+_care_values = itemgetter(*_CARE_STATS)
+_HEALTH_DECAY = DECAY_PER_SECOND["health"]
+# Share of the gap to the care average that health closes per 1/FPS frame.
+_HEALTH_PULL = 0.02
+
+
+def _health_pull(dt: float) -> float:
+    """Health pull for a step of dt seconds, compounded from the per-frame rate."""
+    return 1 - (1 - _HEALTH_PULL) ** (dt * FPS)
+
 
 class Pet:
     def __init__(self, stats: Dict[str, float], sleeping: bool = False) -> None:
@@ -38,14 +63,13 @@ class Pet:
         self.blink_state = 1.0
 
     def apply_time_skip(self, seconds_passed: float) -> None:
-        seconds_passed = max(0.0, seconds_passed)
-        for stat, decay in DECAY_PER_SECOND.items():
-            self.stats[stat] = clamp(self.stats[stat] - decay * seconds_passed, STAT_MIN, STAT_MAX)
-        self._sync_health()
+        # A skip is folded in as one pull, not compounded over the missed frames.
+        self._apply_decay(max(0.0, seconds_passed), _HEALTH_PULL)
 
     def update(self, dt: float) -> None:
+        pull = _health_pull(dt)
         if not self.sleeping:
-            self._apply_decay(dt)
+            self._apply_decay(dt, pull)
         else:
             self.sleep_timer -= dt
             self.stats["energy"] = clamp(self.stats["energy"] + 4 * dt, STAT_MIN, STAT_MAX)
@@ -53,16 +77,19 @@ class Pet:
             if self.sleep_timer <= 0:
                 self.sleeping = False
                 self.say("That nap was perfect!")
+            self._sync_health(pull)
         self.idle_timer += dt
         if self.idle_timer >= self.next_idle_trigger and not self.sleeping:
             self.say(random.choice(IDLE_MESSAGES))
             self.idle_timer = 0
             self.next_idle_trigger = random_in_range(IDLE_DIALOGUE_INTERVAL)
+        self._update_mood()
+
+    def update_animation(self, dt: float) -> None:
+        """Per-frame timers that drive visuals; the stat simulation runs in update()."""
         if self.message_timer > 0:
             self.message_timer -= dt
         self._update_blink(dt)
-        self._sync_health()
-        self._update_mood()
 
     def perform_action(self, action: str) -> Dict[str, str | float]:
         response: Dict[str, str | float] = {}
@@ -101,7 +128,7 @@ class Pet:
         return {"effect": "heart", "sound_freq": 650}
 
     def respond_to_text(self, text: str) -> Dict[str, str | float]:
-        response_text = pick_response(text, RESPONSE_LIBRARY, TYPE_RESPONSE_FALLBACKS)
+        response_text = pick_response(text, RESPONSE_PATTERN, RESPONSE_REPLIES, TYPE_RESPONSE_FALLBACKS)
         self.say(response_text)
         self.screen_bounce = 0.7
         return {"sound_freq": 420}
@@ -114,32 +141,37 @@ class Pet:
     def is_showing_message(self) -> bool:
         return self.message_timer > 0 and bool(self.message)
 
-    def _apply_decay(self, dt: float) -> None:
-        for stat, decay in DECAY_PER_SECOND.items():
-            self.stats[stat] = clamp(self.stats[stat] - decay * dt, STAT_MIN, STAT_MAX)
+    def _apply_decay(self, dt: float, pull: float) -> None:
+        """Decay every stat and fold in the health sync, touching each stat once."""
+        stats = self.stats
+        total = 0.0
+        for stat, decay in _CARE_DECAY:
+            value = clamp(stats[stat] - decay * dt, STAT_MIN, STAT_MAX)
+            stats[stat] = value
+            total += value
+        health = clamp(stats["health"] - _HEALTH_DECAY * dt, STAT_MIN, STAT_MAX)
+        stats["health"] = clamp(health + (total / 4 - health) * pull, STAT_MIN, STAT_MAX)
 
     def _update_mood(self) -> None:
         if self.sleeping:
             self.mood = "sleeping"
             return
-        if self.stats["health"] <= MOOD_THRESHOLDS["sick"]["health"]:
+        stats = self.stats
+        if stats["health"] <= _SICK_HEALTH:
             self.mood = "sick"
             return
-        priority = ["hungry", "sleepy", "dirty", "bored"]
-        for mood in priority:
-            for stat, limit in MOOD_THRESHOLDS[mood].items():
-                if self.stats[stat] <= limit:
-                    self.mood = mood
-                    return
-        thresholds = MOOD_THRESHOLDS["happy"]
-        if all(self.stats[name] >= limit for name, limit in thresholds.items()):
+        for mood, stat, limit in _MOOD_LIMITS:
+            if stats[stat] <= limit:
+                self.mood = mood
+                return
+        if all(stats[name] >= limit for name, limit in _HAPPY_LIMITS):
             self.mood = "excited"
         else:
             self.mood = "idle"
 
-    def _sync_health(self) -> None:
-        avg = sum(self.stats[key] for key in ("hunger", "happiness", "energy", "cleanliness")) / 4
-        delta = (avg - self.stats["health"]) * 0.02
+    def _sync_health(self, pull: float) -> None:
+        avg = sum(_care_values(self.stats)) / 4
+        delta = (avg - self.stats["health"]) * pull
         self.stats["health"] = clamp(self.stats["health"] + delta, STAT_MIN, STAT_MAX)
 
     def _update_blink(self, dt: float) -> None:
@@ -1,3 +1,4 @@
+import re
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -7,6 +8,8 @@ SOUND_DIR = BASE_DIR / "assets" / "sounds"
 SCREEN_WIDTH = 960
 SCREEN_HEIGHT = 640
 FPS = 60
+# Stats drift by fractions of a point per second, so the simulation ticks at 10 Hz
+SIM_STEP = 0.1
 
 STAT_MIN = 0
 STAT_MAX = 100
@@ -92,6 +95,12 @@ RESPONSE_LIBRARY = {
     "love": "Love you right back!",
 }
 
+# All keywords in one case-insensitive alternation so a reply takes a single scan.
+# Each keyword is its own group: the group index picks the reply, since case-folded
+# matches (e.g. "ſ" for "s") cannot be turned back into a library key.
+RESPONSE_PATTERN = re.compile("|".join(f"({re.escape(keyword)})" for keyword in RESPONSE_LIBRARY), re.IGNORECASE)
+RESPONSE_REPLIES = tuple(RESPONSE_LIBRARY.values())
+
 TYPE_RESPONSE_FALLBACKS = [
     "Tell me more!",
     "Haha, you're funny!",
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from typing import Callable, Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import pygame
 
@@ -15,6 +15,41 @@ from settings import (
 )
 from utils import ease_out_back, get_day_night_colors, lerp, screen_center, wrap_text
 
+TEXT_CACHE_SIZE = 512
+PET_SPRITE_CACHE_SIZE = 32
+EYE_BUCKETS = 8
+EYE_OFFSET_X = 45
+EYE_OFFSET_Y = -20
+
+# One breathing cycle (sin(ms / 500), period 1000*pi ms) sampled into 256 steps.
+_BREATH_LUT = [math.sin(index * 2 * math.pi / 256) for index in range(256)]
+_BREATH_STEP = 256 / (1000 * math.pi)
+
+_MOOD_COLORS = {
+    "idle": (255, 220, 220),
+    "excited": (255, 250, 180),
+    "hungry": (255, 180, 150),
+    "sleeping": (200, 200, 230),
+    "dirty": (210, 200, 255),
+    "bored": (200, 255, 220),
+    "sick": (255, 200, 200),
+    "sleepy": (230, 230, 255),
+}
+
+# Rendered text keyed by (font, text, color); the UI repeats the same few hundred strings.
+_text_cache: Dict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface] = {}
+
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int] = COLOR_PALETTE["text_primary"]) -> pygame.Surface:
+    key = (id(font), text, color)
+    rendered = _text_cache.get(key)
+    if rendered is None:
+        if len(_text_cache) >= TEXT_CACHE_SIZE:
+            # Dicts keep insertion order, so this drops the oldest entry.
+            del _text_cache[next(iter(_text_cache))]
+        rendered = _text_cache[key] = font.render(text, True, color).convert_alpha()
+    return rendered
+
 
 class Button:
     def __init__(self, rect: Tuple[int, int, int, int], label: str, action: str) -> None:
@@ -22,14 +57,21 @@ class Button:
         self.label = label
         self.action = action
         self.is_pressed = False
-
-    def draw(self, surface: pygame.Surface, font: pygame.font.Font, active: bool = True) -> None:
+        # Rounded body + border per fill color; only a handful of colors ever occur.
+        self._bases: Dict[Tuple[int, int, int], pygame.Surface] = {}
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        font: pygame.font.Font,
+        mouse_pos: Tuple[int, int],
+        active: bool = True,
+    ) -> None:
         base_color = COLOR_PALETTE["accent_dark" if active else "panel_light"]
         hover_color = COLOR_PALETTE["accent"]
-        color = hover_color if self.rect.collidepoint(pygame.mouse.get_pos()) and active else base_color
-        pygame.draw.rect(surface, color, self.rect, border_radius=18)
-        pygame.draw.rect(surface, (0, 0, 0), self.rect, width=2, border_radius=18)
-        label_surface = font.render(self.label, True, COLOR_PALETTE["text_primary"])
+        color = hover_color if self.rect.collidepoint(mouse_pos) and active else base_color
+        surface.blit(self._base(color), self.rect)
+        label_surface = render_text(font, self.label)
         surface.blit(label_surface, label_surface.get_rect(center=self.rect.center))
 
     def handle_event(self, event: pygame.event.Event) -> bool:
@@ -43,48 +85,88 @@ class Button:
             self.is_pressed = False
         return False
 
+    def _base(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        base = self._bases.get(color)
+        if base is None:
+            base = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            local = base.get_rect()
+            pygame.draw.rect(base, color, local, border_radius=18)
+            pygame.draw.rect(base, (0, 0, 0), local, width=2, border_radius=18)
+            base = self._bases[color] = base.convert_alpha()
+        return base
+
 
 class StatBar:
     def __init__(self, label: str, color: Tuple[int, int, int], rect: Tuple[int, int, int, int]) -> None:
         self.label = label
         self.color = color
         self.rect = pygame.Rect(rect)
+        # Track + fill, re-rasterized only when the fill width moves by a pixel.
+        self._bar: Optional[pygame.Surface] = None
+        self._fill_width = -1
 
     def draw(self, surface: pygame.Surface, font: pygame.font.Font, value: float) -> None:
-        pygame.draw.rect(surface, COLOR_PALETTE["panel_light"], self.rect, border_radius=10)
         inner_width = int(self.rect.width * (value / 100))
-        inner_rect = pygame.Rect(self.rect.x, self.rect.y, inner_width, self.rect.height)
-        pygame.draw.rect(surface, self.color, inner_rect, border_radius=10)
-        text_surface = font.render(f"{self.label}: {int(value)}%", True, COLOR_PALETTE["text_primary"])
+        if inner_width != self._fill_width:
+            self._fill_width = inner_width
+            self._bar = self._render_bar(inner_width)
+        surface.blit(self._bar, self.rect)
+        text_surface = render_text(font, f"{self.label}: {int(value)}%")
         surface.blit(text_surface, (self.rect.x + 12, self.rect.y + 6))
 
+    def state(self, value: float) -> Tuple[int, int]:
+        """What the bar visibly shows for value: fill width and label percent."""
+        return int(self.rect.width * (value / 100)), int(value)
+
+    def _render_bar(self, inner_width: int) -> pygame.Surface:
+        bar = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(bar, COLOR_PALETTE["panel_light"], bar.get_rect(), border_radius=10)
+        pygame.draw.rect(bar, self.color, (0, 0, inner_width, self.rect.height), border_radius=10)
+        return bar.convert_alpha()
+
 
 class SpeechBubble:
     def __init__(self) -> None:
         self.padding = 16
+        # The message stays up for seconds, so the whole bubble is baked once per text.
+        self._key: Optional[Tuple[int, str]] = None
+        self._bubble: Optional[pygame.Surface] = None
+        self._position = (0, 0)
 
-    def draw(self, surface: pygame.Surface, font: pygame.font.Font, text: str) -> None:
+    def draw(self, surface: pygame.Surface, font: pygame.font.Font, text: str) -> Optional[pygame.Rect]:
         if not text:
-            return
+            return None
+        key = (id(font), text)
+        if key != self._key:
+            self._key = key
+            self._bubble, self._position = self._render(font, text)
+        return surface.blit(self._bubble, self._position)
+
+    def _render(self, font: pygame.font.Font, text: str) -> Tuple[pygame.Surface, Tuple[int, int]]:
         max_width = 320
         lines = wrap_text(text, font, max_width)
+        line_height = font.get_linesize()
         width = max(font.size(line)[0] for line in lines) + self.padding * 2
-        height = len(lines) * font.get_linesize() + self.padding * 2
+        height = len(lines) * line_height + self.padding * 2
         pet_center = (PET_AREA[0] + PET_AREA[2] // 2, PET_AREA[1])
         bubble_rect = pygame.Rect(0, 0, width, height)
         bubble_rect.midbottom = (pet_center[0], PET_AREA[1] - 20)
         bubble_rect.y = max(30, bubble_rect.y)
-        pygame.draw.rect(surface, COLOR_PALETTE["panel"], bubble_rect, border_radius=18)
-        pygame.draw.rect(surface, COLOR_PALETTE["accent"], bubble_rect, width=2, border_radius=18)
+        # Local surface holds the bubble plus the 20px tip hanging below it.
+        bubble = pygame.Surface((width, height + 20), pygame.SRCALPHA)
+        local = pygame.Rect(0, 0, width, height)
+        pygame.draw.rect(bubble, COLOR_PALETTE["panel"], local, border_radius=18)
+        pygame.draw.rect(bubble, COLOR_PALETTE["accent"], local, width=2, border_radius=18)
         tip = [
-            (bubble_rect.centerx, bubble_rect.bottom),
-            (bubble_rect.centerx + 20, bubble_rect.bottom + 20),
-            (bubble_rect.centerx - 20, bubble_rect.bottom + 20),
+            (local.centerx, local.bottom),
+            (local.centerx + 20, local.bottom + 20),
+            (local.centerx - 20, local.bottom + 20),
         ]
-        pygame.draw.polygon(surface, COLOR_PALETTE["panel"], tip)
+        pygame.draw.polygon(bubble, COLOR_PALETTE["panel"], tip)
         for index, line in enumerate(lines):
-            render = font.render(line, True, COLOR_PALETTE["text_primary"])
-            surface.blit(render, (bubble_rect.x + self.padding, bubble_rect.y + self.padding + index * font.get_linesize()))
+            render = render_text(font, line)
+            bubble.blit(render, (self.padding, self.padding + index * line_height))
+        return bubble.convert_alpha(), bubble_rect.topleft
 
 
 class TextInput:
@@ -92,12 +174,11 @@ class TextInput:
         self.rect = pygame.Rect(rect)
         self.text = ""
         self.active = False
+        self._bases: Dict[bool, pygame.Surface] = {}
 
     def draw(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
-        color = COLOR_PALETTE["accent"] if self.active else COLOR_PALETTE["panel_light"]
-        pygame.draw.rect(surface, color, self.rect, border_radius=14)
-        pygame.draw.rect(surface, COLOR_PALETTE["panel"], self.rect, width=2, border_radius=14)
-        render = font.render(self.text or "Type to chat...", True, COLOR_PALETTE["text_primary"])
+        surface.blit(self._base(self.active), self.rect)
+        render = render_text(font, self.text or "Type to chat...")
         surface.blit(render, (self.rect.x + 12, self.rect.y + 10))
 
     def handle_event(self, event: pygame.event.Event) -> Tuple[bool, str]:
@@ -116,20 +197,27 @@ class TextInput:
                 self.text += event.unicode
         return False, ""
 
+    def _base(self, active: bool) -> pygame.Surface:
+        base = self._bases.get(active)
+        if base is None:
+            color = COLOR_PALETTE["accent"] if active else COLOR_PALETTE["panel_light"]
+            base = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            local = base.get_rect()
+            pygame.draw.rect(base, color, local, border_radius=14)
+            pygame.draw.rect(base, COLOR_PALETTE["panel"], local, width=2, border_radius=14)
+            base = self._bases[active] = base.convert_alpha()
+        return base
+
 
 class SoundToggle:
     def __init__(self, rect: Tuple[int, int, int, int], enabled: bool = True) -> None:
         self.rect = pygame.Rect(rect)
         self.enabled = enabled
+        self._bases: Dict[bool, pygame.Surface] = {}
 
     def draw(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
-        base_color = COLOR_PALETTE["panel_light"]
-        pygame.draw.rect(surface, base_color, self.rect, border_radius=20)
-        knob_radius = self.rect.height // 2 - 4
-        knob_x = self.rect.x + knob_radius + 4 if not self.enabled else self.rect.right - knob_radius - 4
-        knob_color = COLOR_PALETTE["accent" if self.enabled else "panel"]
-        pygame.draw.circle(surface, knob_color, (knob_x, self.rect.centery), knob_radius)
-        label = font.render("Sound", True, COLOR_PALETTE["text_primary"])
+        surface.blit(self._base(self.enabled), self.rect)
+        label = render_text(font, "Sound")
         surface.blit(label, (self.rect.right + 12, self.rect.y + 5))
 
     def handle_event(self, event: pygame.event.Event) -> bool:
@@ -138,54 +226,79 @@ class SoundToggle:
             return True
         return False
 
+    def _base(self, enabled: bool) -> pygame.Surface:
+        base = self._bases.get(enabled)
+        if base is None:
+            base = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            local = base.get_rect()
+            pygame.draw.rect(base, COLOR_PALETTE["panel_light"], local, border_radius=20)
+            knob_radius = local.height // 2 - 4
+            knob_x = local.x + knob_radius + 4 if not enabled else local.right - knob_radius - 4
+            knob_color = COLOR_PALETTE["accent" if enabled else "panel"]
+            pygame.draw.circle(base, knob_color, (knob_x, local.centery), knob_radius)
+            base = self._bases[enabled] = base.convert_alpha()
+        return base
+
 
 class PetRenderer:
     def __init__(self) -> None:
-        self.surface = pygame.Surface((PET_AREA[2], PET_AREA[3]), pygame.SRCALPHA)
+        # Body, mouth and ears per (mood, radius); only the blinking eyes are drawn every frame.
+        self._bases: Dict[Tuple[str, int], pygame.Surface] = {}
+        # Eye pairs pre-drawn at a few blink heights; finer steps aren't visible.
+        self._eyes = [
+            self._render_eyes(max(6, int(24 * bucket / (EYE_BUCKETS - 1)))) for bucket in range(EYE_BUCKETS)
+        ]
 
-    def draw(self, surface: pygame.Surface, pet, dt: float) -> None:
-        self.surface.fill((0, 0, 0, 0))
+    def draw(self, surface: pygame.Surface, pet, dt: float) -> pygame.Rect:
         bounce = 1 + 0.18 * ease_out_back(min(1.0, max(0.0, pet.screen_bounce)))
-        scale = 1 + 0.08 * math.sin(pygame.time.get_ticks() / 500)
+        scale = 1 + 0.08 * _BREATH_LUT[int(pygame.time.get_ticks() * _BREATH_STEP) & 0xFF]
         if pet.screen_bounce > 0:
             pet.screen_bounce = max(0.0, pet.screen_bounce - dt * 1.5)
         radius = 110 * scale * bounce
-        center = (PET_AREA[2] // 2, PET_AREA[3] // 2)
-        mood_colors = {
-            "idle": (255, 220, 220),
-            "excited": (255, 250, 180),
-            "hungry": (255, 180, 150),
-            "sleeping": (200, 200, 230),
-            "dirty": (210, 200, 255),
-            "bored": (200, 255, 220),
-            "sick": (255, 200, 200),
-            "sleepy": (230, 230, 255),
-        }
-        body_color = mood_colors.get(pet.mood, (255, 240, 220))
-        pygame.draw.circle(self.surface, body_color, center, int(radius))
-        self._draw_face(pet, center, radius)
-        self._draw_ears(body_color, center, radius)
-        surface.blit(self.surface, (PET_AREA[0], PET_AREA[1]))
-
-    def _draw_face(self, pet, center: Tuple[int, int], radius: float) -> None:
-        eye_offset_x = 45
-        eye_offset_y = -20
-        blink_scale = pet.blink_state
+        area = surface.blit(self._base(pet.mood, int(radius)), (PET_AREA[0], PET_AREA[1]))
+        center = (PET_AREA[0] + PET_AREA[2] // 2, PET_AREA[1] + PET_AREA[3] // 2)
+        self._draw_eyes(surface, pet, center)
+        return area
+
+    def _base(self, mood: str, radius: int) -> pygame.Surface:
+        key = (mood, radius)
+        base = self._bases.get(key)
+        if base is None:
+            if len(self._bases) >= PET_SPRITE_CACHE_SIZE:
+                del self._bases[next(iter(self._bases))]
+            body_color = _MOOD_COLORS.get(mood, (255, 240, 220))
+            # Sized to the pet area so the ears clip exactly where they used to.
+            base = pygame.Surface((PET_AREA[2], PET_AREA[3]), pygame.SRCALPHA)
+            center = (PET_AREA[2] // 2, PET_AREA[3] // 2)
+            pygame.draw.circle(base, body_color, center, radius)
+            self._draw_mouth(base, mood, center)
+            self._draw_ears(base, body_color, center, radius)
+            base = self._bases[key] = base.convert_alpha()
+        return base
+
+    def _draw_eyes(self, surface: pygame.Surface, pet, center: Tuple[int, int]) -> None:
+        eyes = self._eyes[int(pet.blink_state * (EYE_BUCKETS - 1))]
+        surface.blit(eyes, eyes.get_rect(center=(center[0], center[1] + EYE_OFFSET_Y)))
+
+    def _render_eyes(self, height: int) -> pygame.Surface:
+        eyes = pygame.Surface((2 * EYE_OFFSET_X + 24, 24), pygame.SRCALPHA)
         for direction in (-1, 1):
-            eye_center = (center[0] + eye_offset_x * direction, center[1] + eye_offset_y)
-            eye_rect = pygame.Rect(0, 0, 24, max(6, int(24 * blink_scale)))
-            eye_rect.center = eye_center
-            pygame.draw.ellipse(self.surface, (40, 40, 60), eye_rect)
+            eye_rect = pygame.Rect(0, 0, 24, height)
+            eye_rect.center = (eyes.get_width() // 2 + EYE_OFFSET_X * direction, 12)
+            pygame.draw.ellipse(eyes, (40, 40, 60), eye_rect)
+        return eyes.convert_alpha()
+
+    def _draw_mouth(self, surface: pygame.Surface, mood: str, center: Tuple[int, int]) -> None:
         mouth_rect = pygame.Rect(0, 0, 60, 25)
         mouth_rect.center = (center[0], center[1] + 30)
-        curve = 10 if pet.mood in ("excited", "idle") else -10
-        pygame.draw.arc(self.surface, (60, 20, 20), mouth_rect, math.radians(180 - curve), math.radians(360 + curve), 4)
+        curve = 10 if mood in ("excited", "idle") else -10
+        pygame.draw.arc(surface, (60, 20, 20), mouth_rect, math.radians(180 - curve), math.radians(360 + curve), 4)
 
-    def _draw_ears(self, color: Tuple[int, int, int], center: Tuple[int, int], radius: float) -> None:
+    def _draw_ears(self, surface: pygame.Surface, color: Tuple[int, int, int], center: Tuple[int, int], radius: float) -> None:
         ear_positions = [(-radius * 0.6, -radius * 0.5), (radius * 0.6, -radius * 0.5)]
         for offset_x, offset_y in ear_positions:
             ear_center = (center[0] + int(offset_x), center[1] + int(offset_y))
-            pygame.draw.circle(self.surface, color, ear_center, int(radius * 0.45))
+            pygame.draw.circle(surface, color, ear_center, int(radius * 0.45))
 
 
 class GameUI:
@@ -201,6 +314,13 @@ class GameUI:
         self.particles = ParticleSystem()
         self.sound_toggle = SoundToggle((40, 40, 80, 36))
         self.pet_renderer = PetRenderer()
+        # Sky + ground only change with the wall clock, so they are kept as one opaque surface.
+        self._background: Optional[pygame.Surface] = None
+        self._background_key: Optional[Tuple[Tuple[int, int, int], Tuple[int, int, int]]] = None
+        # Everything except the pet, bubble and particles, redrawn only when its visible state changes.
+        self._frame = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._frame_key: Optional[tuple] = None
+        self._dynamic_rects: List[pygame.Rect] = []
 
     def _create_buttons(self) -> None:
         width = 150
@@ -230,22 +350,62 @@ class GameUI:
             rect = (x, y + index * spacing, bar_width, bar_height)
             self.stat_bars[stat] = StatBar(stat.capitalize(), color, rect)
 
-    def draw(self, surface: pygame.Surface, pet, dt: float) -> None:
-        sky, ground = get_day_night_colors()
-        surface.fill(sky)
-        pygame.draw.rect(surface, ground, (0, SCREEN_HEIGHT - 160, SCREEN_WIDTH, 200))
+    def draw(self, surface: pygame.Surface, pet, dt: float) -> List[pygame.Rect]:
+        """Draw the frame and return the screen rects that changed since the last one."""
+        colors = get_day_night_colors()
+        mouse_pos = pygame.mouse.get_pos()
+        active = not pet.sleeping
+        frame_key = (
+            colors,
+            tuple(bar.state(pet.stats[stat]) for stat, bar in self.stat_bars.items()),
+            active,
+            tuple(button.rect.collidepoint(mouse_pos) for button in self.buttons),
+            self.text_input.text,
+            self.text_input.active,
+            pet.mood,
+            self.sound_toggle.enabled,
+        )
+        if frame_key != self._frame_key:
+            self._frame_key = frame_key
+            self._render_frame(pet, colors, mouse_pos, active)
+            surface.blit(self._frame, (0, 0))
+            dirty = [surface.get_rect()]
+        else:
+            # Static parts are unchanged: only wipe what the animated layer drew last frame.
+            for rect in self._dynamic_rects:
+                surface.blit(self._frame, rect, rect)
+            dirty = list(self._dynamic_rects)
+        dynamic: List[pygame.Rect] = []
+        if pet.is_showing_message:
+            dynamic.append(self.speech_bubble.draw(surface, self.font_small, pet.message))
+        dynamic.append(self.pet_renderer.draw(surface, pet, dt))
+        particle_rects = self.particles.draw(surface)
+        if particle_rects:
+            dynamic.append(particle_rects[0].unionall(particle_rects[1:]))
+        self._dynamic_rects = dynamic
+        dirty.extend(dynamic)
+        return dirty
+
+    def _render_frame(self, pet, colors, mouse_pos: Tuple[int, int], active: bool) -> None:
+        if colors != self._background_key:
+            self._background_key = colors
+            self._background = self._render_background(*colors)
+        frame = self._frame
+        frame.blit(self._background, (0, 0))
         for stat, bar in self.stat_bars.items():
-            bar.draw(surface, self.font_small, pet.stats[stat])
+            bar.draw(frame, self.font_small, pet.stats[stat])
         for button in self.buttons:
-            button.draw(surface, self.font_small, active=not pet.sleeping)
-        self.text_input.draw(surface, self.font_small)
-        if pet.is_showing_message:
-            self.speech_bubble.draw(surface, self.font_small, pet.message)
-        self.pet_renderer.draw(surface, pet, dt)
-        self.particles.draw(surface)
-        status = self.font_small.render(f"Mood: {pet.mood}", True, COLOR_PALETTE["text_primary"])
-        surface.blit(status, (SCREEN_WIDTH - status.get_width() - 40, 40))
-        self.sound_toggle.draw(surface, self.font_small)
+            button.draw(frame, self.font_small, mouse_pos, active=active)
+        self.text_input.draw(frame, self.font_small)
+        status = render_text(self.font_small, f"Mood: {pet.mood}")
+        frame.blit(status, (SCREEN_WIDTH - status.get_width() - 40, 40))
+        self.sound_toggle.draw(frame, self.font_small)
+
+    def _render_background(self, sky: Tuple[int, int, int], ground: Tuple[int, int, int]) -> pygame.Surface:
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        background.fill(sky)
+        pygame.draw.rect(background, ground, (0, SCREEN_HEIGHT - 160, SCREEN_WIDTH, 200))
+        return background.convert()
 
     def handle_event(self, event: pygame.event.Event, on_action: Callable[[str], None]) -> Tuple[bool, str]:
         submitted = False
@@ -1,13 +1,20 @@
 import math
 import random
+import re
 import time
-from typing import Iterable, List, Sequence, Tuple
+from array import array
+from typing import Callable, Iterable, List, Sequence, Tuple
 
 from settings import COLOR_PALETTE, SCREEN_HEIGHT, SCREEN_WIDTH
 
 
 def clamp(value: float, minimum: float, maximum: float) -> float:
-    return max(minimum, min(maximum, value))
+    # Plain comparisons: cheaper than two builtin max/min calls on this hot path.
+    if value > maximum:
+        value = maximum
+    if value < minimum:
+        return minimum
+    return value
 
 
 def lerp(a: float, b: float, t: float) -> float:
@@ -17,7 +24,8 @@ def lerp(a: float, b: float, t: float) -> float:
 def ease_out_back(t: float) -> float:
     c1 = 1.70158
     c3 = c1 + 1
-    return 1 + c3 * pow(t - 1, 3) + c1 * pow(t - 1, 2)
+    u = t - 1
+    return 1 + (c3 * u + c1) * u * u
 
 
 def map_range(value: float, in_min: float, in_max: float, out_min: float, out_max: float) -> float:
@@ -27,12 +35,27 @@ def map_range(value: float, in_min: float, in_max: float, out_min: float, out_ma
     return out_min + normalized * (out_max - out_min)
 
 
+def make_map_range(in_min: float, in_max: float, out_min: float, out_max: float) -> Callable[[float], float]:
+    """Specialize map_range for fixed bounds, folding the division into a scale and bias."""
+    scale = (out_max - out_min) / (in_max - in_min)
+    bias = out_min - in_min * scale
+    return lambda value: value * scale + bias
+
+
+_map_midday = make_map_range(0.2, 0.8, 0.0, 1.0)
+_map_evening = make_map_range(0.8, 1.0, 0.0, 1.0)
+
+
 def get_day_night_colors(system_time: float | None = None) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
     """Return sky and ground colors based on local time of day."""
     if system_time is None:
         system_time = time.time()
     tm = time.localtime(system_time)
-    day_fraction = (tm.tm_hour * 60 + tm.tm_min) / (24 * 60)
+    return _COLORS_BY_MINUTE[tm.tm_hour * 60 + tm.tm_min]
+
+
+def _blend_day_night(minute: int) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+    day_fraction = minute / (24 * 60)
     sky = blend_palette(
         COLOR_PALETTE["sky_night"],
         COLOR_PALETTE["sky_day"],
@@ -50,31 +73,56 @@ def get_day_night_colors(system_time: float | None = None) -> Tuple[Tuple[int, i
 
 def blend_palette(night: Sequence[int], day: Sequence[int], evening: Sequence[int], fraction: float) -> Tuple[int, int, int]:
     if 0.2 <= fraction <= 0.8:
-        t = map_range(fraction, 0.2, 0.8, 0.0, 1.0)
-        color = tuple(int(lerp(day[i], evening[i], abs(0.5 - t) * 2)) for i in range(3))
-    elif fraction < 0.2:
-        t = fraction / 0.2
-        color = tuple(int(lerp(night[i], day[i], t)) for i in range(3))
-    else:
-        t = map_range(fraction, 0.8, 1.0, 0.0, 1.0)
-        color = tuple(int(lerp(evening[i], night[i], t)) for i in range(3))
-    return color
+        t = _map_midday(fraction)
+        return _lerp_color(day, evening, abs(0.5 - t) * 2)
+    if fraction < 0.2:
+        return _lerp_color(night, day, fraction / 0.2)
+    return _lerp_color(evening, night, _map_evening(fraction))
+
+
+def _lerp_color(a: Sequence[int], b: Sequence[int], t: float) -> Tuple[int, int, int]:
+    return (
+        int(a[0] + (b[0] - a[0]) * t),
+        int(a[1] + (b[1] - a[1]) * t),
+        int(a[2] + (b[2] - a[2]) * t),
+    )
+
+
+WORD_WIDTH_CACHE_SIZE = 4096
+
+# Measured word widths keyed by (font, word), so each line is sized by addition.
+_word_widths: dict = {}
+
+
+def _text_width(font, text: str) -> int:
+    key = (id(font), text)
+    width = _word_widths.get(key)
+    if width is None:
+        if len(_word_widths) >= WORD_WIDTH_CACHE_SIZE:
+            del _word_widths[next(iter(_word_widths))]
+        width = _word_widths[key] = font.size(text)[0]
+    return width
 
 
 def wrap_text(text: str, font, max_width: int) -> List[str]:
     words = text.split()
     lines: List[str] = []
-    current = ""
+    current: List[str] = []
+    current_width = 0
+    space_width = _text_width(font, " ")
     for word in words:
-        candidate = f"{current} {word}".strip()
-        if font.size(candidate)[0] <= max_width:
-            current = candidate
+        word_width = _text_width(font, word)
+        candidate_width = current_width + space_width + word_width if current else word_width
+        if candidate_width <= max_width:
+            current.append(word)
+            current_width = candidate_width
         else:
             if current:
-                lines.append(current)
-            current = word
+                lines.append(" ".join(current))
+            current = [word]
+            current_width = word_width
     if current:
-        lines.append(current)
+        lines.append(" ".join(current))
     return lines
 
 
@@ -86,14 +134,14 @@ def screen_center() -> Tuple[int, int]:
     return SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
 
 
-def build_tone_samples(frequency: float, duration: float, volume: float = 0.4, sample_rate: int = 44100) -> bytearray:
+def build_tone_samples(frequency: float, duration: float, volume: float = 0.4, sample_rate: int = 44100) -> bytes:
     sample_count = int(sample_rate * duration)
-    buffer = bytearray()
-    for index in range(sample_count):
-        sample = volume * math.sin(2 * math.pi * frequency * index / sample_rate)
-        sample_int = int(sample * 32767)
-        buffer.extend(sample_int.to_bytes(2, byteorder="little", signed=True))
-    return buffer
+    # Constants folded out of the loop; array("h") packs native int16 without per-sample byte objects.
+    step = 2 * math.pi * frequency / sample_rate
+    amplitude = volume * 32767
+    sin = math.sin
+    samples = array("h", [int(amplitude * sin(step * index)) for index in range(sample_count)])
+    return samples.tobytes()
 
 
 def create_tone_sound(pygame_module, frequency: float, duration: float, volume: float = 0.4):
@@ -101,9 +149,12 @@ def create_tone_sound(pygame_module, frequency: float, duration: float, volume:
     return pygame_module.mixer.Sound(buffer=samples)
 
 
-def pick_response(text: str, library: dict[str, str], fallbacks: Iterable[str]) -> str:
-    lowered = text.lower()
-    for keyword, line in library.items():
-        if keyword in lowered:
-            return line
+def pick_response(text: str, pattern: re.Pattern[str], replies: Sequence[str], fallbacks: Iterable[str]) -> str:
+    match = pattern.search(text)
+    if match:
+        return replies[match.lastindex - 1]
     return random.choice(list(fallbacks))
+
+
+# Only the minute of the day matters, so all 1440 sky/ground pairs are blended at import.
+_COLORS_BY_MINUTE = [_blend_day_night(minute) for minute in range(24 * 60)]
@@ -3,21 +3,152 @@
 from __future__ import annotations
 
 import base64
-import copy
+import hashlib
+import json
 import os
+import queue
 import random
 import threading
+import time
 import tkinter as tk
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
 from tkinter import ttk
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import requests
 
 
+ICON_CACHE_DIR = Path.home() / ".cache" / "nebula"
+# Raw current-weather responses, one file per city and clock hour.
+WEATHER_CACHE_DIR = ICON_CACHE_DIR / "weather"
+WEATHER_CACHE_SECONDS = 3600
+
+# Emoji fallbacks keyed by the two-digit OpenWeather icon prefix.
+_ICON_EMOJI = MappingProxyType(
+    {
+        "01": "☀️",
+        "02": "🌤",
+        "03": "☁️",
+        "04": "☁️",
+        "09": "🌧",
+        "10": "🌦",
+        "11": "⛈",
+        "13": "❄️",
+        "50": "🌫",
+    }
+)
+# Full OpenWeather codes ("10d", "10n", ...) resolve without slicing the prefix off.
+_ICON_CODE_EMOJI = MappingProxyType(
+    {prefix + variant: emoji for prefix, emoji in _ICON_EMOJI.items() for variant in "dn"}
+)
+
+
+@lru_cache(maxsize=64)
+def _icon_to_emoji(icon_code: str) -> str:
+    emoji = _ICON_CODE_EMOJI.get(icon_code)
+    if emoji is None:
+        emoji = _ICON_EMOJI.get(icon_code[:2], "☁️")
+    return emoji
+
+
 class WeatherClientError(Exception):
     """Custom error type for user-facing weather issues."""
 
 
+@dataclass(frozen=True)
+class HourlyEntry:
+    """One slot of the hourly strip."""
+
+    __slots__ = ("time", "temp", "icon")
+    time: str
+    temp: str
+    icon: str
+
+
+@dataclass(frozen=True)
+class WeeklyEntry:
+    """One row of the week glance panel."""
+
+    __slots__ = ("day", "status", "high", "low")
+    day: str
+    status: str
+    high: str
+    low: str
+
+
+# Designer-friendly weather snapshots for preview mode, built once and shared read-only.
+_PREVIEW_PROFILES = tuple(
+    MappingProxyType(
+        {
+            **profile,
+            "hourly": tuple(HourlyEntry(**entry) for entry in profile["hourly"]),
+            "weekly": tuple(WeeklyEntry(**entry) for entry in profile["weekly"]),
+        }
+    )
+    for profile in (
+        {
+            "location": "Lisbon, PT",
+            "temperature": "24°C",
+            "description": "Hazy Sunshine",
+            "icon": "01d",
+            "chips": {"Feels Like": "26°C", "Wind": "12 km/h", "Humidity": "58%"},
+            "details": {
+                "Pressure": "1018 hPa",
+                "Visibility": "10 km",
+                "UV": "Moderate",
+                "Air Quality": "42 AQI",
+            },
+            "hourly": [
+                {"time": "09:00", "temp": "22°", "icon": "01d"},
+                {"time": "12:00", "temp": "25°", "icon": "02d"},
+                {"time": "15:00", "temp": "27°", "icon": "02d"},
+                {"time": "18:00", "temp": "23°", "icon": "03d"},
+                {"time": "21:00", "temp": "20°", "icon": "03n"},
+                {"time": "00:00", "temp": "18°", "icon": "04n"},
+            ],
+            "weekly": [
+                {"day": "Mon", "status": "☀️", "high": "28°", "low": "18°"},
+                {"day": "Tue", "status": "⛅", "high": "26°", "low": "17°"},
+                {"day": "Wed", "status": "🌦", "high": "24°", "low": "16°"},
+                {"day": "Thu", "status": "🌤", "high": "25°", "low": "15°"},
+                {"day": "Fri", "status": "☀️", "high": "27°", "low": "18°"},
+            ],
+        },
+        {
+            "location": "Kyoto, JP",
+            "temperature": "19°C",
+            "description": "Gentle Rain",
+            "icon": "10d",
+            "chips": {"Feels Like": "18°C", "Wind": "8 km/h", "Humidity": "72%"},
+            "details": {
+                "Pressure": "1009 hPa",
+                "Visibility": "7 km",
+                "UV": "Low",
+                "Air Quality": "55 AQI",
+            },
+            "hourly": [
+                {"time": "08:00", "temp": "17°", "icon": "10d"},
+                {"time": "11:00", "temp": "18°", "icon": "10d"},
+                {"time": "14:00", "temp": "19°", "icon": "10d"},
+                {"time": "17:00", "temp": "18°", "icon": "04d"},
+                {"time": "20:00", "temp": "17°", "icon": "10n"},
+                {"time": "23:00", "temp": "16°", "icon": "10n"},
+            ],
+            "weekly": [
+                {"day": "Sat", "status": "🌧", "high": "20°", "low": "15°"},
+                {"day": "Sun", "status": "🌦", "high": "22°", "low": "16°"},
+                {"day": "Mon", "status": "☁️", "high": "21°", "low": "15°"},
+                {"day": "Tue", "status": "🌤", "high": "24°", "low": "17°"},
+                {"day": "Wed", "status": "☀️", "high": "26°", "low": "18°"},
+            ],
+        },
+    )
+)
+
+
 class WeatherApp:
     """Encapsulates the Tkinter UI and weather fetching logic."""
 
@@ -37,10 +168,19 @@ class WeatherApp:
     CLOUD_COLOR = "#f3f6ff"
     HERO_WIDTH = 520
     HERO_HEIGHT = 240
+    # Cloud speeds are pixels per 60 ms; frames are paced to ~16 ms and scaled by elapsed time.
+    CLOUD_SPEED_MS = 60
+    CLOUD_FRAME_MS = 16
+    # Startup fade: ease-out-cubic alpha values applied every 30 ms.
+    FADE_STEPS = tuple(round(1 - (1 - index / 20) ** 3, 3) for index in range(21))
 
     HERO_CHIPS = ["Feels Like", "Wind", "Humidity"]
     DETAIL_FIELDS = ["Pressure", "Visibility", "UV", "Air Quality"]
 
+    # Fixed shape of the hourly/weekly stubs shown alongside live data.
+    HOURLY_STUB = (("09:00", -2), ("12:00", 3), ("15:00", 4), ("18:00", 0), ("21:00", -3), ("00:00", -4))
+    WEEKLY_STUB = (("Mon", "☀️"), ("Tue", "⛅"), ("Wed", "🌦"), ("Thu", "☁️"), ("Fri", "☀️"))
+
     def __init__(self) -> None:
         self.api_key = os.environ.get("OPENWEATHER_API_KEY")
         self.root = tk.Tk()
@@ -52,9 +192,13 @@ class WeatherApp:
 
         self.city_var = tk.StringVar(value="Lisbon")
         self.status_var = tk.StringVar(value="Preview mode · sample data active")
+        self._last_status = self.status_var.get()
 
         self.icon_image: Optional[tk.PhotoImage] = None
         self.hero_icon_image: Optional[tk.PhotoImage] = None
+        self._sky_photo: Optional[tk.PhotoImage] = None
+        # Decoded hero icons by icon code; Tk needs these references kept alive anyway.
+        self._icon_photos: Dict[str, tk.PhotoImage] = {}
         self.sky_canvas: Optional[tk.Canvas] = None
         self.hero_temp_item: Optional[int] = None
         self.hero_location_item: Optional[int] = None
@@ -62,12 +206,29 @@ class WeatherApp:
         self.hero_icon_symbol_item: Optional[int] = None
         self.hero_icon_image_item: Optional[int] = None
         self.hero_chip_items: List[Dict[str, int]] = []
+        # Last option values set on hero canvas items, keyed by (item, option).
+        self._canvas_values: Dict[Tuple[int, str], object] = {}
         self.clouds: List[Dict[str, object]] = []
-        self.detail_labels: Dict[str, tk.Label] = {}
-        self.hourly_cards: List[Dict[str, tk.Label]] = []
-        self.weekly_cards: List[Dict[str, tk.Label]] = []
-        self.preview_profiles = self._build_dummy_profiles()
+        self._last_cloud_tick: Optional[float] = None
+        # Panel labels are bound to StringVars, so an update is a single variable write.
+        self.detail_vars: Dict[str, tk.StringVar] = {}
+        self.hourly_cards: List[Dict[str, tk.StringVar]] = []
+        self.weekly_cards: List[Dict[str, tk.StringVar]] = []
+        # Last values pushed into each panel; unchanged fields and cards are not rewritten.
+        self._last_detail: Dict[str, str] = {}
+        self._last_hourly: Dict[int, HourlyEntry] = {}
+        self._last_weekly: Dict[int, WeeklyEntry] = {}
+        self.preview_profiles = _PREVIEW_PROFILES
         self.sample_index = 0
+        # One long-lived worker and HTTP session serve every live lookup, in request order.
+        self._session = requests.Session()
+        self._city_requests: "queue.Queue[str]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        # Base64 icon payloads by OpenWeather icon code; only the worker thread touches it.
+        self._icon_cache: Dict[str, str] = {}
+        # Results that land within one frame are painted once, using the newest payload.
+        self._paint_pending: Optional[str] = None
+        self._pending_weather: Optional[Tuple[Dict[str, object], Optional[str]]] = None
 
         self._build_styles()
         self._build_ui()
@@ -77,67 +238,6 @@ class WeatherApp:
         # Boot with the first sample profile so the UI never feels empty.
         self._apply_weather(self._sample_weather(self.city_var.get()), None)
 
-    def _build_dummy_profiles(self) -> List[Dict[str, object]]:
-        """Curate a handful of designer-friendly weather snapshots."""
-        return [
-            {
-                "location": "Lisbon, PT",
-                "temperature": "24°C",
-                "description": "Hazy Sunshine",
-                "icon": "01d",
-                "chips": {"Feels Like": "26°C", "Wind": "12 km/h", "Humidity": "58%"},
-                "details": {
-                    "Pressure": "1018 hPa",
-                    "Visibility": "10 km",
-                    "UV": "Moderate",
-                    "Air Quality": "42 AQI",
-                },
-                "hourly": [
-                    {"time": "09:00", "temp": "22°", "icon": "01d"},
-                    {"time": "12:00", "temp": "25°", "icon": "02d"},
-                    {"time": "15:00", "temp": "27°", "icon": "02d"},
-                    {"time": "18:00", "temp": "23°", "icon": "03d"},
-                    {"time": "21:00", "temp": "20°", "icon": "03n"},
-                    {"time": "00:00", "temp": "18°", "icon": "04n"},
-                ],
-                "weekly": [
-                    {"day": "Mon", "status": "☀️", "high": "28°", "low": "18°"},
-                    {"day": "Tue", "status": "⛅", "high": "26°", "low": "17°"},
-                    {"day": "Wed", "status": "🌦", "high": "24°", "low": "16°"},
-                    {"day": "Thu", "status": "🌤", "high": "25°", "low": "15°"},
-                    {"day": "Fri", "status": "☀️", "high": "27°", "low": "18°"},
-                ],
-            },
-            {
-                "location": "Kyoto, JP",
-                "temperature": "19°C",
-                "description": "Gentle Rain",
-                "icon": "10d",
-                "chips": {"Feels Like": "18°C", "Wind": "8 km/h", "Humidity": "72%"},
-                "details": {
-                    "Pressure": "1009 hPa",
-                    "Visibility": "7 km",
-                    "UV": "Low",
-                    "Air Quality": "55 AQI",
-                },
-                "hourly": [
-                    {"time": "08:00", "temp": "17°", "icon": "10d"},
-                    {"time": "11:00", "temp": "18°", "icon": "10d"},
-                    {"time": "14:00", "temp": "19°", "icon": "10d"},
-                    {"time": "17:00", "temp": "18°", "icon": "04d"},
-                    {"time": "20:00", "temp": "17°", "icon": "10n"},
-                    {"time": "23:00", "temp": "16°", "icon": "10n"},
-                ],
-                "weekly": [
-                    {"day": "Sat", "status": "🌧", "high": "20°", "low": "15°"},
-                    {"day": "Sun", "status": "🌦", "high": "22°", "low": "16°"},
-                    {"day": "Mon", "status": "☁️", "high": "21°", "low": "15°"},
-                    {"day": "Tue", "status": "🌤", "high": "24°", "low": "17°"},
-                    {"day": "Wed", "status": "☀️", "high": "26°", "low": "18°"},
-                ],
-            },
-        ]
-
     def _prepare_window_alpha(self) -> None:
         try:
             self.root.attributes("-alpha", 0.0)
@@ -260,9 +360,10 @@ class WeatherApp:
             row.pack(fill="x", pady=6)
             label = tk.Label(row, text=field, font=("Segoe UI", 11), fg=self.TEXT_MUTED, bg=self.PANEL_BG)
             label.pack(side="left")
-            value = tk.Label(row, text="--", font=("Segoe UI", 12, "bold"), fg=self.TEXT_PRIMARY, bg=self.PANEL_BG)
+            value_var = tk.StringVar(value="--")
+            value = tk.Label(row, textvariable=value_var, font=("Segoe UI", 12, "bold"), fg=self.TEXT_PRIMARY, bg=self.PANEL_BG)
             value.pack(side="right")
-            self.detail_labels[field] = value
+            self.detail_vars[field] = value_var
 
         hourly_frame = tk.Frame(
             content,
@@ -296,13 +397,14 @@ class WeatherApp:
                 highlightthickness=1,
             )
             card.pack(side="left", expand=True, fill="both", padx=4)
-            time_label = tk.Label(card, text="--", font=("Segoe UI", 10), fg=self.TEXT_MUTED, bg=self.PANEL_LIGHT)
+            card_vars = {"time": tk.StringVar(value="--"), "icon": tk.StringVar(value="☀️"), "temp": tk.StringVar(value="--")}
+            time_label = tk.Label(card, textvariable=card_vars["time"], font=("Segoe UI", 10), fg=self.TEXT_MUTED, bg=self.PANEL_LIGHT)
             time_label.pack(anchor="w")
-            icon_label = tk.Label(card, text="☀️", font=("Segoe UI", 18), fg=self.TEXT_PRIMARY, bg=self.PANEL_LIGHT)
+            icon_label = tk.Label(card, textvariable=card_vars["icon"], font=("Segoe UI", 18), fg=self.TEXT_PRIMARY, bg=self.PANEL_LIGHT)
             icon_label.pack(anchor="center", pady=(4, 4))
-            temp_label = tk.Label(card, text="--", font=("Segoe UI Semibold", 13), fg=self.TEXT_PRIMARY, bg=self.PANEL_LIGHT)
+            temp_label = tk.Label(card, textvariable=card_vars["temp"], font=("Segoe UI Semibold", 13), fg=self.TEXT_PRIMARY, bg=self.PANEL_LIGHT)
             temp_label.pack(anchor="center")
-            self.hourly_cards.append({"time": time_label, "icon": icon_label, "temp": temp_label})
+            self.hourly_cards.append(card_vars)
 
         weekly_frame = tk.Frame(
             content,
@@ -326,13 +428,14 @@ class WeatherApp:
         for _ in range(5):
             row = tk.Frame(weekly_frame, bg=self.PANEL_DARK)
             row.pack(fill="x", pady=6)
-            day_label = tk.Label(row, text="--", font=("Segoe UI", 11), fg=self.TEXT_MUTED, bg=self.PANEL_DARK)
+            row_vars = {"day": tk.StringVar(value="--"), "icon": tk.StringVar(value="☁️"), "temp": tk.StringVar(value="--")}
+            day_label = tk.Label(row, textvariable=row_vars["day"], font=("Segoe UI", 11), fg=self.TEXT_MUTED, bg=self.PANEL_DARK)
             day_label.pack(side="left")
-            icon_label = tk.Label(row, text="☁️", font=("Segoe UI", 12), fg=self.TEXT_PRIMARY, bg=self.PANEL_DARK)
+            icon_label = tk.Label(row, textvariable=row_vars["icon"], font=("Segoe UI", 12), fg=self.TEXT_PRIMARY, bg=self.PANEL_DARK)
             icon_label.pack(side="left", padx=10)
-            temp_label = tk.Label(row, text="--", font=("Segoe UI", 11), fg=self.TEXT_PRIMARY, bg=self.PANEL_DARK)
+            temp_label = tk.Label(row, textvariable=row_vars["temp"], font=("Segoe UI", 11), fg=self.TEXT_PRIMARY, bg=self.PANEL_DARK)
             temp_label.pack(side="right")
-            self.weekly_cards.append({"day": day_label, "icon": icon_label, "temp": temp_label})
+            self.weekly_cards.append(row_vars)
 
         status_bar = tk.Label(
             wrapper,
@@ -347,20 +450,18 @@ class WeatherApp:
         if not self.sky_canvas:
             return
         self.sky_canvas.delete("sky")
-        steps = 60
-        for index in range(steps):
-            ratio = index / (steps - 1)
-            color = self._interpolate_color(self.SKY_TOP, self.SKY_BOTTOM, ratio)
-            y0 = (self.HERO_HEIGHT / steps) * index
-            self.sky_canvas.create_rectangle(
-                0,
-                y0,
-                self.HERO_WIDTH,
-                y0 + (self.HERO_HEIGHT / steps) + 2,
-                outline="",
-                fill=color,
-                tags="sky",
-            )
+        # Bake the bands into one image so the canvas holds a single item instead of 60 rectangles.
+        if self._sky_photo is None:
+            self._sky_photo = tk.PhotoImage(width=self.HERO_WIDTH, height=self.HERO_HEIGHT)
+            steps = 60
+            band = self.HERO_HEIGHT / steps
+            for index in range(steps):
+                ratio = index / (steps - 1)
+                color = self._interpolate_color(self.SKY_TOP, self.SKY_BOTTOM, ratio)
+                y0 = int(band * index)
+                y1 = min(self.HERO_HEIGHT, int(band * index + band + 2))
+                self._sky_photo.put(color, to=(0, y0, self.HERO_WIDTH, y1))
+        self.sky_canvas.create_image(0, 0, anchor="nw", image=self._sky_photo, tags="sky")
         self.sky_canvas.create_oval(
             self.HERO_WIDTH - 160,
             10,
@@ -452,11 +553,13 @@ class WeatherApp:
             {"x": 30, "y": 80, "scale": 0.9, "speed": 0.7},
             {"x": 220, "y": 140, "scale": 1.1, "speed": 0.5},
         ]
-        for spec in specs:
-            parts = self._draw_cloud(spec["x"], spec["y"], spec["scale"])
-            self.clouds.append({"parts": parts, "speed": spec["speed"]})
+        for index, spec in enumerate(specs):
+            tag = f"cloud{index}"
+            self._draw_cloud(spec["x"], spec["y"], spec["scale"], tag)
+            # Left edge and width are tracked here so wrapping needs no canvas bbox query.
+            self.clouds.append({"tag": tag, "x": spec["x"], "width": 155 * spec["scale"], "speed": spec["speed"]})
 
-    def _draw_cloud(self, x: float, y: float, scale: float) -> List[int]:
+    def _draw_cloud(self, x: float, y: float, scale: float, tag: str) -> List[int]:
         if not self.sky_canvas:
             return []
         blobs = [
@@ -474,7 +577,7 @@ class WeatherApp:
                     y + bottom * scale,
                     fill=self.CLOUD_COLOR,
                     outline="",
-                    tags="cloud",
+                    tags=("cloud", tag),
                 )
             )
         return ids
@@ -483,19 +586,29 @@ class WeatherApp:
         if not self.sky_canvas or not self.clouds:
             self.root.after(180, self._start_cloud_animation)
             return
+        if self.root.state() == "iconic":
+            # Minimized: idle cheaply and restart timing so clouds don't jump on restore.
+            self._last_cloud_tick = None
+            self.root.after(250, self._start_cloud_animation)
+            return
+        now = time.monotonic()
+        elapsed_ms = self.CLOUD_SPEED_MS if self._last_cloud_tick is None else (now - self._last_cloud_tick) * 1000
+        self._last_cloud_tick = now
+        # Clamp long stalls so a busy main loop resumes smoothly instead of teleporting clouds.
+        scale = min(elapsed_ms, 4 * self.CLOUD_SPEED_MS) / self.CLOUD_SPEED_MS
         width = self.sky_canvas.winfo_width() or self.HERO_WIDTH
         for cloud in self.clouds:
-            parts = cloud.get("parts", [])
-            speed = cloud.get("speed", 0.5)
-            for part in parts:
-                self.sky_canvas.move(part, speed, 0)
-            if parts:
-                bbox = self.sky_canvas.bbox(*parts)
-                if bbox and bbox[0] > width + 60:
-                    shift = -(bbox[2] + 60)
-                    for part in parts:
-                        self.sky_canvas.move(part, shift, 0)
-        self.root.after(60, self._start_cloud_animation)
+            step = cloud["speed"] * scale
+            cloud["x"] += step
+            if cloud["x"] > width + 60:
+                # Past the right edge: jump back to just beyond the left edge in the same move.
+                shift = -(cloud["x"] + cloud["width"] + 60)
+                cloud["x"] += shift
+                step += shift
+            self.sky_canvas.move(cloud["tag"], step, 0)
+        # Subtract this tick's own cost so the cadence holds when Tk is busy.
+        spent_ms = (time.monotonic() - now) * 1000
+        self.root.after(max(1, int(self.CLOUD_FRAME_MS - spent_ms)), self._start_cloud_animation)
 
     def _interpolate_color(self, start_hex: str, end_hex: str, ratio: float) -> str:
         ratio = max(0.0, min(1.0, ratio))
@@ -505,6 +618,7 @@ class WeatherApp:
         return self._rgb_to_hex(blended)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _hex_to_rgb(value: str) -> Tuple[int, int, int]:
         value = value.lstrip("#")
         return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
@@ -513,12 +627,14 @@ class WeatherApp:
     def _rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
         return "#" + "".join(f"{component:02x}" for component in rgb)
 
-    def _fade_window_in(self, step: float = 0.0) -> None:
+    def _fade_window_in(self) -> None:
+        # Queue the whole ramp at once instead of each step re-scheduling the next.
+        for index, alpha in enumerate(self.FADE_STEPS):
+            self.root.after(index * 30, self._set_alpha, alpha)
+
+    def _set_alpha(self, alpha: float) -> None:
         try:
-            alpha = min(step, 1.0)
             self.root.attributes("-alpha", alpha)
-            if alpha < 1.0:
-                self.root.after(30, self._fade_window_in, alpha + 0.05)
         except tk.TclError:
             pass
 
@@ -530,53 +646,104 @@ class WeatherApp:
         self._set_loading_state(True)
         if not self.api_key:
             preview_weather = self._sample_weather(city)
-            self.root.after(350, lambda: self._apply_weather(preview_weather, None))
+            self.root.after(350, self._schedule_paint, preview_weather, None)
             return
-        worker = threading.Thread(target=self._retrieve_weather, args=(city,), daemon=True)
-        worker.start()
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+            self._worker.start()
+        self._city_requests.put(city)
 
     def _set_loading_state(self, loading: bool) -> None:
         text = "Fetching..." if loading else "Refresh"
         self.fetch_button.config(text=text, state="disabled" if loading else "normal")
         if loading:
-            self.status_var.set("Updating panels...")
+            self._set_status("Updating panels...")
+
+    def _worker_loop(self) -> None:
+        while True:
+            self._retrieve_weather(self._city_requests.get())
 
     def _retrieve_weather(self, city: str) -> None:
         try:
             weather = self._call_weather_api(city)
             icon_data = self._download_icon(weather.get("icon", ""))
         except WeatherClientError as exc:
-            self.root.after(0, lambda: self._show_error(str(exc)))
+            self.root.after(0, self._show_error, str(exc))
+        except Exception:
+            # The worker is shared by every later lookup, so nothing may end its loop.
+            self.root.after(0, self._show_error, "Something went wrong. Please try again.")
         else:
-            self.root.after(0, lambda: self._apply_weather(weather, icon_data))
+            self.root.after(0, self._schedule_paint, weather, icon_data)
 
     def _call_weather_api(self, city: str) -> Dict[str, object]:
+        bucket = int(time.time() // WEATHER_CACHE_SECONDS)
+        city_key = hashlib.sha1(city.casefold().encode("utf-8")).hexdigest()
+        cache_path = WEATHER_CACHE_DIR / f"{city_key}-{bucket}.json"
+        try:
+            weather = self._normalize_live_payload(json.loads(cache_path.read_text(encoding="utf-8")))
+            # Cached data can be most of an hour old, so the status bar says when it was fetched.
+            weather["cached_at"] = time.strftime("%H:%M", time.localtime(cache_path.stat().st_mtime))
+            return weather
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            pass
         endpoint = "https://api.openweathermap.org/data/2.5/weather"
         params = {"q": city, "appid": self.api_key, "units": "metric"}
         try:
-            response = requests.get(endpoint, params=params, timeout=8)
+            response = self._session.get(endpoint, params=params, timeout=8)
         except requests.RequestException as exc:
             raise WeatherClientError("Unable to reach the weather service.") from exc
         if response.status_code == 404:
             raise WeatherClientError("City not found. Try another search.")
         if response.status_code != 200:
             raise WeatherClientError("Weather service error. Please try later.")
-        payload = response.json()
-        return self._normalize_live_payload(payload)
+        try:
+            weather = self._normalize_live_payload(response.json())
+        except (ValueError, KeyError, IndexError, TypeError) as exc:
+            raise WeatherClientError("Weather service sent an unexpected response.") from exc
+        self._store_weather_response(cache_path, bucket, response.text)
+        return weather
+
+    def _store_weather_response(self, cache_path: Path, bucket: int, text: str) -> None:
+        try:
+            WEATHER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Drop responses from earlier hours before writing the fresh one.
+            for stale in WEATHER_CACHE_DIR.glob("*.json"):
+                if not stale.stem.endswith(f"-{bucket}"):
+                    stale.unlink()
+            cache_path.write_text(text, encoding="utf-8")
+        except OSError:
+            pass
 
     def _download_icon(self, icon_code: str) -> Optional[str]:
-        if not icon_code:
+        if not icon_code or not icon_code.isalnum():
             return None
-        icon_url = f"https://openweathermap.org/img/wn/{icon_code}@2x.png"
+        cached = self._icon_cache.get(icon_code)
+        if cached is not None:
+            return cached
+        # There are only a couple dozen icon codes, so they are kept on disk across launches too.
+        icon_path = ICON_CACHE_DIR / f"{icon_code}.png"
         try:
-            response = requests.get(icon_url, timeout=8)
-            response.raise_for_status()
-        except requests.RequestException:
-            return None
-        return base64.b64encode(response.content).decode("ascii")
+            content = icon_path.read_bytes()
+        except OSError:
+            icon_url = f"https://openweathermap.org/img/wn/{icon_code}@2x.png"
+            try:
+                response = self._session.get(icon_url, timeout=8)
+                response.raise_for_status()
+            except requests.RequestException:
+                return None
+            content = response.content
+            try:
+                ICON_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                icon_path.write_bytes(content)
+            except OSError:
+                pass
+        encoded = self._icon_cache[icon_code] = base64.b64encode(content).decode("ascii")
+        return encoded
 
     def _sample_weather(self, city: str) -> Dict[str, object]:
-        profile = copy.deepcopy(self.preview_profiles[self.sample_index % len(self.preview_profiles)])
+        template = self.preview_profiles[self.sample_index % len(self.preview_profiles)]
+        # Only top-level fields are rewritten below; nested panels are copied shallowly or shared read-only.
+        profile = {**template, "chips": dict(template["chips"]), "details": dict(template["details"])}
         self.sample_index += 1
         if city:
             parts = profile["location"].split(",")
@@ -613,21 +780,25 @@ class WeatherApp:
             "weekly": self._generate_weekly_stub(temp),
         }
 
-    def _generate_hourly_stub(self, temp: int) -> List[Dict[str, str]]:
-        labels = ["09:00", "12:00", "15:00", "18:00", "21:00", "00:00"]
-        data = []
-        for index, label in enumerate(labels):
-            delta = (-2, 3, 4, 0, -3, -4)[index]
-            data.append({"time": label, "temp": f"{temp + delta}°", "icon": "01d"})
-        return data
-
-    def _generate_weekly_stub(self, temp: int) -> List[Dict[str, str]]:
-        days = ["Mon", "Tue", "Wed", "Thu", "Fri"]
-        emojis = ["☀️", "⛅", "🌦", "☁️", "☀️"]
-        data = []
-        for idx, day in enumerate(days):
-            data.append({"day": day, "status": emojis[idx], "high": f"{temp + idx}°", "low": f"{temp - 4 + idx}°"})
-        return data
+    def _generate_hourly_stub(self, temp: int) -> List[HourlyEntry]:
+        return [HourlyEntry(label, f"{temp + delta}°", "01d") for label, delta in self.HOURLY_STUB]
+
+    def _generate_weekly_stub(self, temp: int) -> List[WeeklyEntry]:
+        return [
+            WeeklyEntry(day, status, f"{temp + idx}°", f"{temp - 4 + idx}°")
+            for idx, (day, status) in enumerate(self.WEEKLY_STUB)
+        ]
+
+    def _schedule_paint(self, weather: Dict[str, object], icon_data: Optional[str]) -> None:
+        self._pending_weather = (weather, icon_data)
+        if self._paint_pending is None:
+            self._paint_pending = self.root.after(16, self._flush_paint)
+
+    def _flush_paint(self) -> None:
+        self._paint_pending = None
+        pending, self._pending_weather = self._pending_weather, None
+        if pending is not None:
+            self._apply_weather(*pending)
 
     def _apply_weather(self, weather: Dict[str, object], icon_data: Optional[str]) -> None:
         self._set_loading_state(False)
@@ -638,63 +809,88 @@ class WeatherApp:
 
         mode_text = "Live" if self.api_key else "Preview"
         self.mode_badge.config(text=mode_text)
-        self.status_var.set("Updated from sample set." if not self.api_key else "Live data refreshed.")
+        if not self.api_key:
+            self._set_status("Updated from sample set.")
+        elif "cached_at" in weather:
+            self._set_status(f"Showing data fetched at {weather['cached_at']}.")
+        else:
+            self._set_status("Live data refreshed.")
+        # Flush every pending redraw in one pass rather than piecemeal as the loop idles.
+        self.root.update_idletasks()
 
     def _update_hero_card(self, weather: Dict[str, object], icon_data: Optional[str]) -> None:
         if not self.sky_canvas:
             return
-        self.sky_canvas.itemconfigure(self.hero_location_item, text=str(weather.get("location", "--")))
-        self.sky_canvas.itemconfigure(self.hero_temp_item, text=str(weather.get("temperature", "--")))
-        self.sky_canvas.itemconfigure(self.hero_condition_item, text=str(weather.get("description", "--")))
+        self._configure_item(self.hero_location_item, "text", str(weather.get("location", "--")))
+        self._configure_item(self.hero_temp_item, "text", str(weather.get("temperature", "--")))
+        self._configure_item(self.hero_condition_item, "text", str(weather.get("description", "--")))
 
         chips: Dict[str, str] = weather.get("chips", {})  # type: ignore[assignment]
         for index, label in enumerate(self.HERO_CHIPS):
             value = chips.get(label, "--") if isinstance(chips, dict) else "--"
-            self.sky_canvas.itemconfigure(self.hero_chip_items[index]["value"], text=value)
+            self._configure_item(self.hero_chip_items[index]["value"], "text", value)
 
+        icon_code = str(weather.get("icon", ""))
         if icon_data:
-            self.hero_icon_image = tk.PhotoImage(data=icon_data)
-            self.sky_canvas.itemconfigure(self.hero_icon_image_item, image=self.hero_icon_image)
-            self.sky_canvas.itemconfigure(self.hero_icon_symbol_item, text="")
+            photo = self._icon_photos.get(icon_code)
+            if photo is None:
+                photo = self._icon_photos[icon_code] = tk.PhotoImage(data=icon_data)
+            self.hero_icon_image = photo
+            self._configure_item(self.hero_icon_image_item, "image", self.hero_icon_image)
+            self._configure_item(self.hero_icon_symbol_item, "text", "")
         else:
-            self.sky_canvas.itemconfigure(self.hero_icon_image_item, image="")
-            self.sky_canvas.itemconfigure(self.hero_icon_symbol_item, text="☀️")
+            self._configure_item(self.hero_icon_image_item, "image", "")
+            self._configure_item(self.hero_icon_symbol_item, "text", "☀️")
+
+    def _configure_item(self, item: int, option: str, value: object) -> None:
+        # Reconfiguring a canvas item invalidates its region even when nothing changed.
+        key = (item, option)
+        if self._canvas_values.get(key) == value:
+            return
+        self._canvas_values[key] = value
+        self.sky_canvas.itemconfigure(item, **{option: value})
 
     def _update_detail_panel(self, weather: Dict[str, object]) -> None:
         details: Dict[str, str] = weather.get("details", {})  # type: ignore[assignment]
-        for field, label in self.detail_labels.items():
-            label.config(text=details.get(field, "--"))
+        last = self._last_detail
+        for field, var in self.detail_vars.items():
+            value = details.get(field, "--")
+            if last.get(field) == value:
+                continue
+            var.set(value)
+            last[field] = value
 
     def _update_hourly_panel(self, weather: Dict[str, object]) -> None:
-        hourly: List[Dict[str, str]] = weather.get("hourly", [])  # type: ignore[assignment]
-        for card, data in zip(self.hourly_cards, hourly):
-            card["time"].config(text=data.get("time", "--"))
-            card["icon"].config(text=self._icon_to_emoji(data.get("icon", "")))
-            card["temp"].config(text=data.get("temp", "--"))
+        hourly: Sequence[HourlyEntry] = weather.get("hourly", ())  # type: ignore[assignment]
+        last = self._last_hourly
+        for index, (card, entry) in enumerate(zip(self.hourly_cards, hourly)):
+            if last.get(index) == entry:
+                continue
+            card["time"].set(entry.time)
+            card["icon"].set(_icon_to_emoji(entry.icon))
+            card["temp"].set(entry.temp)
+            last[index] = entry
 
     def _update_weekly_panel(self, weather: Dict[str, object]) -> None:
-        weekly: List[Dict[str, str]] = weather.get("weekly", [])  # type: ignore[assignment]
-        for card, data in zip(self.weekly_cards, weekly):
-            card["day"].config(text=data.get("day", "--"))
-            card["icon"].config(text=data.get("status", "☁️"))
-            card["temp"].config(text=f"{data.get('high', '--')}/{data.get('low', '--')}")
-
-    def _icon_to_emoji(self, icon_code: str) -> str:
-        mapping = {
-            "01": "☀️",
-            "02": "🌤",
-            "03": "☁️",
-            "04": "☁️",
-            "09": "🌧",
-            "10": "🌦",
-            "11": "⛈",
-            "13": "❄️",
-            "50": "🌫",
-        }
-        return mapping.get(icon_code[:2], "☁️")
+        weekly: Sequence[WeeklyEntry] = weather.get("weekly", ())  # type: ignore[assignment]
+        last = self._last_weekly
+        for index, (card, entry) in enumerate(zip(self.weekly_cards, weekly)):
+            if last.get(index) == entry:
+                continue
+            card["day"].set(entry.day)
+            card["icon"].set(entry.status)
+            card["temp"].set(f"{entry.high}/{entry.low}")
+            last[index] = entry
 
     def _show_error(self, message: str) -> None:
         self._set_loading_state(False)
+        self._set_status(message)
+
+    def _set_status(self, message: str) -> None:
+        # Writing the same text still fires the variable's traces and relayouts the label.
+        if message == self._last_status:
+            return
+        self._last_status = message
         self.status_var.set(message)
 
     def run(self) -> None: